@@ -9,9 +9,11 @@ Handles:
 - Cross-platform configuration normalization
 """
 
+import os
 import json
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 from .path_manager import PathManager
 
@@ -57,6 +59,75 @@ class AgentConfig:
     sequential_forbidden: bool = True
 
 
+# Numeric CLAUDE.md settings as (section, field, type); the field name is
+# also the key searched for on each line, in this order
+NUMERIC_CLAUDE_MD_SETTINGS = (
+    ("performance", "session_continuity_lines", int),
+    ("agents", "boot_agents", int),
+    ("agents", "work_agents", int),
+    ("patterns", "pattern_match_threshold", float),
+)
+
+
+def _extract_claude_md_settings(content: str) -> Tuple[Tuple[str, str, Any], ...]:
+    """
+    Extract configuration settings from CLAUDE.md content.
+    
+    Args:
+        content: CLAUDE.md file content
+        
+    Returns:
+        (section, field, value) updates in file order
+    """
+    settings = []
+    lines = content.split('\n')
+    
+    for line in lines:
+        line = line.strip()
+        line_lower = line.lower()
+        
+        # Every setting key contains an underscore; skip prose lines early
+        if "_" not in line_lower:
+            continue
+        
+        # Numeric settings: first key found on the line wins
+        for section, field, convert in NUMERIC_CLAUDE_MD_SETTINGS:
+            if field in line_lower:
+                try:
+                    settings.append((section, field, convert(line.split(':')[-1].strip())))
+                except ValueError:
+                    pass
+                break
+        else:
+            # Memory settings
+            if "auto_learning" in line_lower and "enabled" in line_lower:
+                settings.append(("memory", "auto_learning_enabled", "true" in line_lower))
+    
+    return tuple(settings)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_claude_md_settings(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str, Any], ...]:
+    """
+    Read and parse a CLAUDE.md file, memoized on its stat signature.
+    
+    Args:
+        path: CLAUDE.md file path
+        mtime_ns: File modification time (part of the cache key)
+        size: File size in bytes (part of the cache key)
+        
+    Returns:
+        Extracted (section, field, value) settings
+    """
+    # Single read sized from the stat the caller already did
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        data = os.read(fd, size + 1)
+    finally:
+        os.close(fd)
+    return _extract_claude_md_settings(data.decode('utf-8'))
+
+
 class Config:
     """Central configuration manager for Claude Enhancement Framework."""
     
@@ -89,15 +160,17 @@ class Config:
         """
         global_claude_path = self.path_manager.get_global_claude_dir() / "CLAUDE.md"
         
-        if not global_claude_path.exists():
+        try:
+            stat_result = global_claude_path.stat()
+        except OSError:
             return False
         
         try:
-            with open(global_claude_path, 'r', encoding='utf-8') as f:
-                global_content = f.read()
-            
-            # Parse global configuration
-            self._parse_claude_md_content(global_content, is_global=True)
+            # Parse global configuration (cached while the file is unchanged)
+            settings = _load_claude_md_settings(
+                str(global_claude_path), stat_result.st_mtime_ns, stat_result.st_size
+            )
+            self._apply_claude_md_settings(settings)
             self._global_config_loaded = True
             return True
             
@@ -120,15 +193,17 @@ class Config:
             return False
         
         project_claude_path = root / "CLAUDE.md"
-        if not project_claude_path.exists():
+        try:
+            stat_result = project_claude_path.stat()
+        except OSError:
             return False
         
         try:
-            with open(project_claude_path, 'r', encoding='utf-8') as f:
-                project_content = f.read()
-            
-            # Parse project configuration (overrides global)
-            self._parse_claude_md_content(project_content, is_global=False)
+            # Parse project configuration (overrides global, cached while unchanged)
+            settings = _load_claude_md_settings(
+                str(project_claude_path), stat_result.st_mtime_ns, stat_result.st_size
+            )
+            self._apply_claude_md_settings(settings)
             self._project_config_loaded = True
             return True
             
@@ -144,45 +219,17 @@ class Config:
             content: CLAUDE.md file content
             is_global: True if parsing global config
         """
-        lines = content.split('\n')
+        self._apply_claude_md_settings(_extract_claude_md_settings(content))
+    
+    def _apply_claude_md_settings(self, settings: Tuple[Tuple[str, str, Any], ...]):
+        """
+        Apply extracted CLAUDE.md settings to the configuration sections.
         
-        for line in lines:
-            line = line.strip()
-            
-            # Performance settings
-            if "session_continuity_lines" in line.lower():
-                try:
-                    value = int(line.split(':')[-1].strip())
-                    self.performance.session_continuity_lines = value
-                except ValueError:
-                    pass
-            
-            # Agent settings
-            elif "boot_agents" in line.lower():
-                try:
-                    value = int(line.split(':')[-1].strip())
-                    self.agents.boot_agents = value
-                except ValueError:
-                    pass
-            
-            elif "work_agents" in line.lower():
-                try:
-                    value = int(line.split(':')[-1].strip())
-                    self.agents.work_agents = value
-                except ValueError:
-                    pass
-            
-            # Pattern settings
-            elif "pattern_match_threshold" in line.lower():
-                try:
-                    value = float(line.split(':')[-1].strip())
-                    self.patterns.pattern_match_threshold = value
-                except ValueError:
-                    pass
-            
-            # Memory settings
-            elif "auto_learning" in line.lower() and "enabled" in line.lower():
-                self.memory.auto_learning_enabled = "true" in line.lower()
+        Args:
+            settings: (section, field, value) updates in file order
+        """
+        for section, field, value in settings:
+            setattr(getattr(self, section), field, value)
     
     def get_effective_config(self) -> Dict[str, Any]:
         """
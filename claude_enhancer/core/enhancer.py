@@ -10,6 +10,8 @@ Primary interface for:
 - Cross-platform compatibility
 """
 
+import os
+import mmap
 import time
 import hashlib
 from pathlib import Path
@@ -30,6 +32,21 @@ class ClaudeEnhancer:
     - Cross-session memory
     """
     
+    # Directory skeleton created in every enhanced project
+    PROJECT_SUBDIRS = ("memory", "patterns", "tests", "scripts")
+    
+    # (filename, template method name) pairs; methods are only resolved when a file is written
+    GLOBAL_LEARNING_TEMPLATES = (
+        ("PYTHON_LEARNINGS.md", "_get_python_learnings_template"),
+        ("INFRASTRUCTURE_LEARNINGS.md", "_get_infrastructure_learnings_template"),
+        ("PROJECT_SPECIFIC_LEARNINGS.md", "_get_project_learnings_template"),
+    )
+    MEMORY_TEMPLATES = (
+        ("learning_archive.md", "_get_learning_archive_template"),
+        ("error_patterns.md", "_get_error_patterns_template"),
+        ("side_effects_log.md", "_get_side_effects_template"),
+    )
+    
     def __init__(self, username: Optional[str] = None, project_name: Optional[str] = None):
         """
         Initialize Claude Enhancement Framework.
@@ -47,7 +64,7 @@ class ClaudeEnhancer:
         self.config.initialize_framework_defaults()
         
         # Performance tracking
-        self._boot_start_time = None
+        self._boot_start_ns = None
         self._boot_metrics = {}
         
         # State tracking
@@ -65,7 +82,7 @@ class ClaudeEnhancer:
         Returns:
             Deployment results dictionary
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = {
             "success": False,
             "files_created": [],
@@ -90,8 +107,7 @@ class ClaudeEnhancer:
                 )
                 
                 if should_proceed:
-                    with open(global_claude_path, 'w', encoding='utf-8') as f:
-                        f.write(global_template)
+                    global_claude_path.write_text(global_template, encoding='utf-8')
                     
                     if global_claude_path.exists():
                         results["files_created"].append(str(global_claude_path))
@@ -112,21 +128,15 @@ class ClaudeEnhancer:
             corrections_path = global_dir / "LEARNED_CORRECTIONS.md"
             if force or not corrections_path.exists():
                 corrections_template = self._get_learned_corrections_template()
-                with open(corrections_path, 'w', encoding='utf-8') as f:
-                    f.write(corrections_template)
+                corrections_path.write_text(corrections_template, encoding='utf-8')
                 results["files_created"].append(str(corrections_path))
             
             # Deploy other global files
-            for filename, template_func in [
-                ("PYTHON_LEARNINGS.md", self._get_python_learnings_template),
-                ("INFRASTRUCTURE_LEARNINGS.md", self._get_infrastructure_learnings_template),
-                ("PROJECT_SPECIFIC_LEARNINGS.md", self._get_project_learnings_template)
-            ]:
+            for filename, template_method in self.GLOBAL_LEARNING_TEMPLATES:
                 file_path = global_dir / filename
                 if force or not file_path.exists():
-                    template_content = template_func()
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(template_content)
+                    template_content = getattr(self, template_method)()
+                    file_path.write_text(template_content, encoding='utf-8')
                     results["files_created"].append(str(file_path))
             
             self._global_deployed = True
@@ -135,7 +145,7 @@ class ClaudeEnhancer:
         except Exception as e:
             results["errors"].append(f"Global deployment failed: {str(e)}")
         
-        results["deployment_time"] = time.time() - start_time
+        results["deployment_time"] = (time.perf_counter_ns() - start_ns) / 1_000_000_000
         return results
     
     def deploy_project_configuration(self, project_path: Optional[Union[str, Path]] = None, 
@@ -150,7 +160,7 @@ class ClaudeEnhancer:
         Returns:
             Deployment results dictionary
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = {
             "success": False,
             "files_created": [],
@@ -186,8 +196,7 @@ class ClaudeEnhancer:
                 )
                 
                 if should_proceed:
-                    with open(project_claude_path, 'w', encoding='utf-8') as f:
-                        f.write(project_content)
+                    project_claude_path.write_text(project_content, encoding='utf-8')
                     results["files_created"].append(str(project_claude_path))
                 else:
                     print(f"⏭️  Skipped: Project CLAUDE.md (user declined)")
@@ -201,11 +210,14 @@ class ClaudeEnhancer:
                     print(f"✅ Project CLAUDE.md is up to date")
             
             # Create directory structure
-            for dir_name in ["memory", "patterns", "tests", "scripts"]:
-                dir_path = target_dir / dir_name
-                if not dir_path.exists():
-                    dir_path.mkdir(parents=True, exist_ok=True)
-                    results["directories_created"].append(str(dir_path))
+            target_root = str(target_dir)
+            for dir_name in self.PROJECT_SUBDIRS:
+                dir_path = os.path.join(target_root, dir_name)
+                try:
+                    os.mkdir(dir_path)
+                except FileExistsError:
+                    continue
+                results["directories_created"].append(dir_path)
             
             # Deploy SESSION_CONTINUITY.md template
             session_path = target_dir / "SESSION_CONTINUITY.md"
@@ -221,8 +233,7 @@ class ClaudeEnhancer:
                 )
                 
                 if should_proceed:
-                    with open(session_path, 'w', encoding='utf-8') as f:
-                        f.write(session_content)
+                    session_path.write_text(session_content, encoding='utf-8')
                     results["files_created"].append(str(session_path))
                 else:
                     print(f"⏭️  Skipped: SESSION_CONTINUITY.md (user declined)")
@@ -237,18 +248,13 @@ class ClaudeEnhancer:
             
             # Deploy memory system files
             memory_dir = target_dir / "memory"
-            for filename, template_func in [
-                ("learning_archive.md", self._get_learning_archive_template),
-                ("error_patterns.md", self._get_error_patterns_template),
-                ("side_effects_log.md", self._get_side_effects_template)
-            ]:
+            for filename, template_method in self.MEMORY_TEMPLATES:
                 file_path = memory_dir / filename
                 if force or not file_path.exists():
-                    template_content = template_func()
+                    template_content = getattr(self, template_method)()
                     content = self.path_manager.substitute_template_variables(template_content)
                     
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    file_path.write_text(content, encoding='utf-8')
                     results["files_created"].append(str(file_path))
             
             self._project_deployed = True
@@ -257,7 +263,7 @@ class ClaudeEnhancer:
         except Exception as e:
             results["errors"].append(f"Project deployment failed: {str(e)}")
         
-        results["deployment_time"] = time.time() - start_time
+        results["deployment_time"] = (time.perf_counter_ns() - start_ns) / 1_000_000_000
         return results
     
     def initialize_framework(self) -> Dict[str, Any]:
@@ -267,7 +273,7 @@ class ClaudeEnhancer:
         Returns:
             Initialization results dictionary
         """
-        self._boot_start_time = time.time()
+        self._boot_start_ns = time.perf_counter_ns()
         
         results = {
             "success": False,
@@ -307,7 +313,7 @@ class ClaudeEnhancer:
         except Exception as e:
             results["errors"].append(f"Framework initialization failed: {str(e)}")
         
-        boot_time = time.time() - self._boot_start_time
+        boot_time = (time.perf_counter_ns() - self._boot_start_ns) / 1_000_000_000
         results["boot_time"] = boot_time
         
         # Store boot metrics
@@ -1083,13 +1089,14 @@ Generated: {{USER_NAME}} | Claude Enhancement Framework v1.0.0"""
         Returns:
             Comparison results dictionary
         """
+        source_bytes = source_content.encode('utf-8')
         comparison = {
             "destination_exists": destination_path.exists(),
             "size_difference": 0,
             "content_identical": False,
-            "source_size": len(source_content.encode('utf-8')),
+            "source_size": len(source_bytes),
             "destination_size": 0,
-            "source_checksum": hashlib.md5(source_content.encode('utf-8')).hexdigest(),
+            "source_checksum": hashlib.md5(source_bytes).hexdigest(),
             "destination_checksum": None,
             "differences": []
         }
@@ -1099,11 +1106,26 @@ Generated: {{USER_NAME}} | Claude Enhancement Framework v1.0.0"""
             return comparison
         
         try:
-            with open(destination_path, 'r', encoding='utf-8') as f:
-                existing_content = f.read()
+            # Hash the existing file straight from a read-only mapping; a
+            # byte-for-byte match needs no decoding at all
+            with open(destination_path, 'rb') as f:
+                comparison["destination_size"] = os.fstat(f.fileno()).st_size
+                if comparison["destination_size"]:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        comparison["destination_checksum"] = hashlib.md5(mm).hexdigest()
+                else:
+                    comparison["destination_checksum"] = hashlib.md5(b"").hexdigest()
+            
+            existing_content = None
+            if comparison["destination_checksum"] != comparison["source_checksum"]:
+                # Raw bytes can differ only in line endings (write_text emits
+                # CRLF on Windows), so compare the text with universal newlines
+                with open(destination_path, 'r', encoding='utf-8') as f:
+                    existing_content = f.read()
+                existing_bytes = existing_content.encode('utf-8')
+                comparison["destination_size"] = len(existing_bytes)
+                comparison["destination_checksum"] = hashlib.md5(existing_bytes).hexdigest()
             
-            comparison["destination_size"] = len(existing_content.encode('utf-8'))
-            comparison["destination_checksum"] = hashlib.md5(existing_content.encode('utf-8')).hexdigest()
             comparison["size_difference"] = comparison["source_size"] - comparison["destination_size"]
             comparison["content_identical"] = comparison["source_checksum"] == comparison["destination_checksum"]
             
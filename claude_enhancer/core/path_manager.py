@@ -17,6 +17,20 @@ from pathlib import Path
 from typing import Dict, Optional, Union, List, Tuple
 
 
+# Windows invalid characters: < > : " | ? * and control characters
+WINDOWS_INVALID_PATH_CHARS = frozenset('<>:"|?*' + ''.join(chr(i) for i in range(0x20)))
+
+# Device names Windows reserves regardless of extension
+WINDOWS_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    *(f'COM{i}' for i in range(1, 10)),
+    *(f'LPT{i}' for i in range(1, 10))
+})
+
+# Matches {{VARIABLE}} placeholders for single-pass template substitution
+TEMPLATE_VARIABLE_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
 class PathManager:
     """Manages dynamic path resolution for Claude Enhancement Framework."""
     
@@ -156,12 +170,17 @@ class PathManager:
         if extra_vars:
             variables.update(extra_vars)
         
-        result = content
-        for var_name, var_value in variables.items():
-            placeholder = f"{{{{{var_name}}}}}"
-            result = result.replace(placeholder, str(var_value))
+        # Strings pass through as-is; only other types need conversion
+        replacements = {
+            var_name: var_value if isinstance(var_value, str) else str(var_value)
+            for var_name, var_value in variables.items()
+        }
         
-        return result
+        # One scan over content; unknown placeholders are left untouched
+        return TEMPLATE_VARIABLE_PATTERN.sub(
+            lambda match: replacements.get(match.group(1), match.group(0)),
+            content
+        )
     
     def is_project_directory(self, path: Union[str, Path]) -> bool:
         """
@@ -295,30 +314,25 @@ class PathManager:
         Returns:
             True if path format is valid
         """
+        # Check path length limits before any character scanning
+        if len(path_str) > 4096:  # Most systems have limits around this range
+            return False
+        
         # Check for null bytes or other dangerous characters
         if '\x00' in path_str:
             return False
         
         # Platform-specific invalid characters
         if self.platform == "windows":
-            # Windows invalid characters: < > : " | ? * and control characters
-            invalid_chars = r'[<>:"|?*\x00-\x1f]'
-            if re.search(invalid_chars, path_str):
+            if not WINDOWS_INVALID_PATH_CHARS.isdisjoint(path_str):
                 return False
             
             # Windows reserved names
-            reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 
-                             'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 
-                             'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'}
             path_parts = Path(path_str).parts
             for part in path_parts:
-                if part.upper().split('.')[0] in reserved_names:
+                if part.upper().split('.')[0] in WINDOWS_RESERVED_NAMES:
                     return False
         
-        # Check path length limits
-        if len(path_str) > 4096:  # Most systems have limits around this range
-            return False
-        
         return True
     
     def _check_write_permission(self, path: Path) -> bool:
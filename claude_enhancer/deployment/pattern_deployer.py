@@ -10,13 +10,26 @@ Provides pattern deployment capabilities:
 """
 
 import os
+import re
+import mmap
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Set
 from ..core.path_manager import PathManager
 
 
+# Matches the first byte that makes a pattern file non-blank
+NON_WHITESPACE_PATTERN = re.compile(rb'\S')
+
+# Upper bound on threads used to copy pattern files during deployment
+MAX_DEPLOY_WORKERS = 8
+
+# Framework pattern library shipped alongside this package, resolved at import
+FRAMEWORK_PATTERNS_DIR = Path(__file__).parent.parent / "patterns"
+
+
 class PatternDeployer:
     """
     Handles deployment of patterns from framework to target projects.
@@ -52,12 +65,14 @@ class PatternDeployer:
             "{{USER_INPUT}}", "{{PATTERN_CONTENT}}", "{{CODE_BLOCK}}",
             "{{IMPLEMENTATION}}", "{{CUSTOM_LOGIC}}", "{{PROJECT_SPECIFIC}}"
         }
+        # One alternation finds every protected variable in a single scan
+        self._protected_pattern = re.compile(
+            "|".join(re.escape(var) for var in sorted(self.protected_variables))
+        )
     
     def _get_framework_patterns_dir(self) -> Path:
         """Get framework patterns directory."""
-        current_dir = Path(__file__).parent.parent
-        patterns_dir = current_dir / "patterns"
-        return patterns_dir
+        return FRAMEWORK_PATTERNS_DIR
     
     def deploy_patterns(self, target_project: Union[str, Path], 
                        categories: Optional[List[str]] = None,
@@ -107,12 +122,16 @@ class PatternDeployer:
                 results["errors"].append("No patterns found matching deployment criteria")
                 return results
             
-            # Deploy each pattern
-            for pattern_info in patterns_to_deploy:
-                deploy_result = self._deploy_single_pattern(
-                    pattern_info, target_patterns_dir, target_path, force
-                )
-                
+            # Deploy patterns concurrently (file I/O bound); map keeps the original order
+            with ThreadPoolExecutor(max_workers=min(MAX_DEPLOY_WORKERS, len(patterns_to_deploy))) as executor:
+                deploy_results = list(executor.map(
+                    lambda pattern_info: self._deploy_single_pattern(
+                        pattern_info, target_patterns_dir, target_path, force
+                    ),
+                    patterns_to_deploy
+                ))
+            
+            for deploy_result in deploy_results:
                 if deploy_result["success"]:
                     if deploy_result["action"] == "created":
                         results["patterns_deployed"].append(deploy_result["pattern_path"])
@@ -180,11 +199,13 @@ class PatternDeployer:
             category_dir = self.framework_patterns_dir / category
             if category_dir.exists() and category_dir.is_dir():
                 for pattern_file in category_dir.glob("*.md"):
+                    # Path attributes are recomputed on access, so read the name once
+                    file_name = pattern_file.name
                     patterns_to_deploy.append({
                         "source_path": pattern_file,
                         "category": category,
-                        "name": pattern_file.stem,
-                        "relative_path": pattern_file.relative_to(self.framework_patterns_dir)
+                        "name": file_name[:-len(".md")],
+                        "relative_path": Path(category, file_name)
                     })
         
         return patterns_to_deploy
@@ -286,22 +307,23 @@ class PatternDeployer:
         }
         
         # Temporarily protect pattern-specific variables
-        protected_content = content
         protection_map = {}
         
-        for i, protected_var in enumerate(self.protected_variables):
-            if protected_var in content:
-                placeholder = f"__PROTECTED_VAR_{i}__"
-                protection_map[placeholder] = protected_var
-                protected_content = protected_content.replace(protected_var, placeholder)
+        def protect(match):
+            protected_var = match.group(0)
+            if protected_var not in protection_map:
+                protection_map[protected_var] = f"__PROTECTED_VAR_{len(protection_map)}__"
+            return protection_map[protected_var]
+        
+        protected_content = self._protected_pattern.sub(protect, content)
         
         # Apply standard template substitution
         processed_content = self.path_manager.substitute_template_variables(
             protected_content, extra_vars
         )
         
-        # Restore protected variables
-        for placeholder, original_var in protection_map.items():
+        # Restore only the protected variables that were present
+        for original_var, placeholder in protection_map.items():
             processed_content = processed_content.replace(placeholder, original_var)
         
         return processed_content
@@ -433,14 +455,15 @@ class PatternDeployer:
             True if pattern file is valid
         """
         try:
-            # Basic validation - file exists and is readable
-            if not pattern_file.exists() or not pattern_file.is_file():
-                return False
-            
-            # Check file is readable and not empty
-            with open(pattern_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                return len(content) > 0
+            # Basic validation - opening fails for missing files and directories
+            with open(pattern_file, 'rb') as f:
+                # Empty files cannot be mapped and are invalid anyway
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                
+                # Check for any non-whitespace byte without copying the file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return NON_WHITESPACE_PATTERN.search(mapped) is not None
                 
         except Exception:
             return False
@@ -463,21 +486,31 @@ class PatternDeployer:
         
         for category, description in self.pattern_categories.items():
             category_dir = self.framework_patterns_dir / category
-            if category_dir.exists() and category_dir.is_dir():
-                pattern_files = list(category_dir.glob("*.md"))
-                patterns_info["categories"][category] = {
-                    "description": description,
-                    "pattern_count": len(pattern_files),
-                    "patterns": [
-                        {
-                            "name": p.stem,
-                            "file": p.name,
-                            "size": p.stat().st_size if p.exists() else 0
-                        }
-                        for p in pattern_files
-                    ]
-                }
-                patterns_info["total_patterns"] += len(pattern_files)
+            try:
+                # Directory entries carry the stat data, so each file is stat'ed once
+                with os.scandir(category_dir) as entries:
+                    pattern_entries = [entry for entry in entries if entry.name.endswith(".md")]
+            except OSError:
+                continue
+            
+            patterns = []
+            for entry in pattern_entries:
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    size = 0
+                patterns.append({
+                    "name": entry.name[:-len(".md")],
+                    "file": entry.name,
+                    "size": size
+                })
+            
+            patterns_info["categories"][category] = {
+                "description": description,
+                "pattern_count": len(patterns),
+                "patterns": patterns
+            }
+            patterns_info["total_patterns"] += len(patterns)
         
         return patterns_info
     
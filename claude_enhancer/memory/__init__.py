@@ -13,15 +13,15 @@ Templates use variables like {{USER_NAME}}, {{PROJECT_NAME}} for customization.
 import os
 from pathlib import Path
 
+_TEMPLATES_DIR = Path(__file__).parent
+
 def get_template_path(template_name: str) -> Path:
     """Get the full path to a memory template file."""
-    templates_dir = Path(__file__).parent
-    return templates_dir / template_name
+    return _TEMPLATES_DIR / template_name
 
 def list_available_templates() -> list:
     """List all available memory template files."""
-    templates_dir = Path(__file__).parent
-    return [f.name for f in templates_dir.glob("*_template.md")]
+    return [f.name for f in _TEMPLATES_DIR.glob("*_template.md")]
 
 # Template file mappings
 MEMORY_TEMPLATES = {
@@ -13,14 +13,36 @@ Validates:
 TASK: Pattern validation only - DO NOT modify existing patterns
 """
 
+import itertools
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass, asdict
 
 
+# Template variable scanners, compiled once for every pattern file
+TEMPLATE_VAR_PATTERN = re.compile(r'\{\{[^}]+\}\}')
+WELL_FORMED_TEMPLATE_VAR_PATTERN = re.compile(r'\{\{[A-Z_]+\}\}')
+
+# Pattern files are validated concurrently; reads are I/O-bound
+PATTERN_VALIDATION_WORKERS = 8
+
+# Start of a line whose first non-blank character is not a '#' header marker
+BODY_LINE_PATTERN = re.compile(r'^[^\S\n]*[^#\s]', re.MULTILINE)
+MIN_BODY_LINES = 3
+
+# Default patterns directory: the package this module ships in
+DEFAULT_PATTERNS_DIR = Path(__file__).parent
+
+# Common metadata indicators, matched case-insensitively without a lowered copy
+METADATA_INDICATOR_PATTERN = re.compile(
+    r'description:|category:|usage:|example:|pattern:', re.IGNORECASE
+)
+
+
 @dataclass
 class PatternValidationResult:
     """Results from pattern validation."""
@@ -95,8 +117,7 @@ class PatternValidator:
             self.patterns_dir = Path(patterns_dir)
         else:
             # Auto-detect patterns directory
-            current_dir = Path(__file__).parent
-            self.patterns_dir = current_dir
+            self.patterns_dir = DEFAULT_PATTERNS_DIR
         
         self.validation_results: List[PatternValidationResult] = []
         self.pattern_index_path = self.patterns_dir / ".pattern_index.json"
@@ -137,18 +158,23 @@ class PatternValidator:
             report["patterns_missing"] = missing_patterns
             report["patterns_extra"] = extra_patterns
             
-            # 3. Validate each pattern file
-            for category, patterns in self.EXPECTED_PATTERNS.items():
-                if not patterns:  # Skip empty categories like fabric
-                    continue
-                    
-                category_results = []
-                category_dir = self.patterns_dir / category
-                
-                for pattern_file in patterns:
-                    result = self._validate_pattern_file(category_dir / pattern_file, category)
-                    category_results.append(result)
-                    self.validation_results.append(result)
+            # 3. Validate each pattern file (independent file reads, so run
+            # them concurrently and collect results in declaration order)
+            categories = [(category, patterns) for category, patterns
+                          in self.EXPECTED_PATTERNS.items() if patterns]  # Skip empty categories like fabric
+            with ThreadPoolExecutor(max_workers=PATTERN_VALIDATION_WORKERS) as executor:
+                futures = {
+                    category: [
+                        executor.submit(self._validate_pattern_file,
+                                        self.patterns_dir / category / pattern_file, category)
+                        for pattern_file in patterns
+                    ]
+                    for category, patterns in categories
+                }
+            
+            for category, patterns in categories:
+                category_results = [future.result() for future in futures[category]]
+                self.validation_results.extend(category_results)
                 
                 report["category_validation"][category] = {
                     "expected_count": len(patterns),
@@ -225,9 +251,10 @@ class PatternValidator:
             
             # Check for extra patterns
             if category_dir.exists():
+                expected_names = frozenset(expected_patterns)
                 actual_files = [f.name for f in category_dir.glob("*.md")]
                 for actual_file in actual_files:
-                    if actual_file not in expected_patterns:
+                    if actual_file not in expected_names:
                         extra_patterns.append(f"{category}/{actual_file}")
         
         return missing_patterns, extra_patterns
@@ -302,10 +329,9 @@ class PatternValidator:
         if not content.startswith('#'):
             return False
         
-        # Should have some content beyond just headers
-        non_header_lines = [line for line in content.split('\n') 
-                           if line.strip() and not line.strip().startswith('#')]
-        if len(non_header_lines) < 3:
+        # Should have some content beyond just headers (scan stops at the third body line)
+        body_lines = itertools.islice(BODY_LINE_PATTERN.finditer(content), MIN_BODY_LINES)
+        if sum(1 for _ in body_lines) < MIN_BODY_LINES:
             return False
         
         return True
@@ -320,13 +346,7 @@ class PatternValidator:
         Returns:
             True if metadata is present
         """
-        # Look for common metadata indicators
-        metadata_indicators = [
-            "description:", "category:", "usage:", "example:", "pattern:"
-        ]
-        
-        content_lower = content.lower()
-        return any(indicator in content_lower for indicator in metadata_indicators)
+        return METADATA_INDICATOR_PATTERN.search(content) is not None
     
     def _validate_template_variables(self, content: str) -> bool:
         """
@@ -339,11 +359,11 @@ class PatternValidator:
             True if template variables are used correctly
         """
         # Find all template variables in content
-        template_vars = re.findall(r'\{\{[^}]+\}\}', content)
+        template_vars = TEMPLATE_VAR_PATTERN.findall(content)
         
         # Check for malformed variables
         for var in template_vars:
-            if not re.match(r'\{\{[A-Z_]+\}\}', var):
+            if not WELL_FORMED_TEMPLATE_VAR_PATTERN.match(var):
                 return False
         
         return True
@@ -11,8 +11,11 @@ Demonstrates pattern deployment functionality:
 - Deployment validation
 """
 
+import os
 import sys
+import mmap
 from pathlib import Path
+from typing import Dict, Iterable
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,6 +23,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from claude_enhancer.core.enhancer import ClaudeEnhancer
 
 
+def _contains(path: Path, needles: Iterable[bytes]) -> Dict[bytes, bool]:
+    """Probe a file for literal byte strings via mmap, without decoding it."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            return {needle: False for needle in needles}
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return {needle: mm.find(needle) != -1 for needle in needles}
+    finally:
+        os.close(fd)
+
+
 def main():
     """Demonstrate pattern deployment capabilities."""
     print("🚀 Claude Enhancement Framework - Pattern Deployment Example")
@@ -125,19 +140,22 @@ def main():
         break
     
     if sample_pattern:
-        with open(sample_pattern, 'r', encoding='utf-8') as f:
-            content = f.read()
+        project_path = str(target_dir.resolve())
+        protected_vars = ["{{IMPLEMENTATION}}", "{{CUSTOM_LOGIC}}", "{{PATTERN_CONTENT}}"]
+        markers = [b"Christian", b"MyProject", project_path.encode('utf-8')]
+        markers.extend(protected.encode('utf-8') for protected in protected_vars)
+        found = _contains(sample_pattern, markers)
         
         print(f"   Sample pattern: {sample_pattern.name}")
         
         # Check for substituted variables
         variables_found = []
-        if "Christian" in content:
+        if found[b"Christian"]:
             variables_found.append("USER_NAME → Christian")
-        if "MyProject" in content:
+        if found[b"MyProject"]:
             variables_found.append("PROJECT_NAME → MyProject")
-        if str(target_dir.resolve()) in content:
-            variables_found.append(f"PROJECT_PATH → {target_dir.resolve()}")
+        if found[project_path.encode('utf-8')]:
+            variables_found.append(f"PROJECT_PATH → {project_path}")
         
         if variables_found:
             print("   ✅ Variables substituted:")
@@ -146,8 +164,8 @@ def main():
         
         # Check for protected variables
         protected_found = []
-        for protected in ["{{IMPLEMENTATION}}", "{{CUSTOM_LOGIC}}", "{{PATTERN_CONTENT}}"]:
-            if protected in content:
+        for protected in protected_vars:
+            if found[protected.encode('utf-8')]:
                 protected_found.append(protected)
         
         if protected_found:
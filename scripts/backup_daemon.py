@@ -18,7 +18,9 @@ import logging
 from pathlib import Path
 
 # Add scripts directory to path for imports
-sys.path.append(str(Path(__file__).parent))
+SCRIPTS_DIR = str(Path(__file__).parent)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
 
 from backup_integration import BackupIntegration
 
@@ -51,6 +53,7 @@ class BackupDaemon:
         self.running = False
         self.check_interval_seconds = 300  # Check every 5 minutes
         self.daemon_thread = None
+        self._stop_event = threading.Event()
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -75,6 +78,7 @@ class BackupDaemon:
         logger.info("Enforcing 120-minute backup intervals automatically")
         
         self.running = True
+        self._stop_event.clear()
         self.daemon_thread = threading.Thread(target=self._daemon_loop, daemon=True)
         self.daemon_thread.start()
         
@@ -88,6 +92,7 @@ class BackupDaemon:
         
         logger.info("Stopping backup daemon...")
         self.running = False
+        self._stop_event.set()
         
         if self.daemon_thread and self.daemon_thread.is_alive():
             self.daemon_thread.join(timeout=10)
@@ -102,11 +107,8 @@ class BackupDaemon:
             try:
                 self._check_and_enforce_backup()
                 
-                # Sleep for check interval, but break early if stopping
-                for _ in range(self.check_interval_seconds):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+                # Sleep for check interval in one wait, woken early by stop()
+                self._stop_event.wait(self.check_interval_seconds)
                     
             except Exception as e:
                 logger.error(f"Error in daemon loop: {e}")
@@ -4,8 +4,10 @@
 # Usage: Used by handoff and continuity systems
 # Requirements: python3, standard library modules
 
+import io
 import os
 import json
+import functools
 import shutil
 import hashlib
 import datetime
@@ -17,6 +19,13 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Single stat call standing in for exists() followed by stat()."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 class BackupIntegration:
     """
     Backup system integration for CLAUDE project handoff system.
@@ -55,13 +64,14 @@ class BackupIntegration:
         Returns:
             bool: True if backup is needed, False otherwise
         """
-        if not self.marker_file.exists():
+        marker_stat = _stat_or_none(self.marker_file)
+        if marker_stat is None:
             logger.info("No backup marker found - backup required")
             return True
             
         try:
             last_backup_time = datetime.datetime.fromtimestamp(
-                self.marker_file.stat().st_mtime
+                marker_stat.st_mtime
             )
             current_time = datetime.datetime.now()
             minutes_since_backup = (current_time - last_backup_time).total_seconds() / 60
@@ -123,12 +133,9 @@ class BackupIntegration:
             
             # Create backup metadata
             metadata = self._create_backup_metadata(backup_name, reason, files_backed_up)
-            metadata_file = backup_path / "backup_info.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, default=str)
             
-            # Verify backup integrity
-            if self._verify_backup_integrity(backup_path):
+            # Verify backup integrity (writes metadata with verification status)
+            if self._verify_backup_integrity(backup_path, metadata):
                 # Update marker file
                 self.marker_file.touch()
                 
@@ -163,16 +170,15 @@ class BackupIntegration:
         git_status = "No git repository"
         try:
             import subprocess
-            result = subprocess.run(
+            # Raw bytes are enough to count lines; non-zero exit raises and keeps the default
+            output = subprocess.check_output(
                 ["git", "status", "--short"], 
                 cwd=self.project_root,
-                capture_output=True, 
-                text=True, 
+                stderr=subprocess.DEVNULL, 
                 timeout=5
             )
-            if result.returncode == 0:
-                uncommitted_changes = len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-                git_status = f"{uncommitted_changes} uncommitted changes"
+            uncommitted_changes = len(output.splitlines())
+            git_status = f"{uncommitted_changes} uncommitted changes"
         except Exception:
             pass
         
@@ -194,19 +200,28 @@ class BackupIntegration:
         """Count lines in a file."""
         try:
             file_path = self.project_root / filename
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return len(f.readlines())
+            # Count newlines in raw fixed-size chunks instead of decoding and splitting lines
+            line_count = 0
+            last_chunk = b""
+            with open(file_path, 'rb') as f:
+                for chunk in iter(functools.partial(f.read, io.DEFAULT_BUFFER_SIZE), b""):
+                    line_count += chunk.count(b"\n")
+                    last_chunk = chunk
+            # A final line without a trailing newline still counts
+            if last_chunk and not last_chunk.endswith(b"\n"):
+                line_count += 1
+            return line_count
         except Exception:
             pass
         return 0
 
-    def _verify_backup_integrity(self, backup_path: Path) -> bool:
+    def _verify_backup_integrity(self, backup_path: Path, metadata: Optional[Dict] = None) -> bool:
         """
         Verify backup integrity through file comparisons and checksums.
         
         Args:
             backup_path: Path to the backup directory
+            metadata: In-memory backup metadata; read from backup_info.json if omitted
             
         Returns:
             bool: True if backup is valid, False otherwise
@@ -218,10 +233,13 @@ class BackupIntegration:
                 source_file = self.project_root / file_name
                 backup_file = backup_path / file_name
                 
-                if source_file.exists() and backup_file.exists():
+                source_stat = _stat_or_none(source_file)
+                backup_stat = _stat_or_none(backup_file) if source_stat else None
+                
+                if source_stat and backup_stat:
                     # Compare file sizes
-                    source_size = source_file.stat().st_size
-                    backup_size = backup_file.stat().st_size
+                    source_size = source_stat.st_size
+                    backup_size = backup_stat.st_size
                     
                     if source_size != backup_size:
                         logger.error(f"Size mismatch for {file_name}: {source_size} vs {backup_size}")
@@ -240,15 +258,16 @@ class BackupIntegration:
                     
                     verification_results.append(True)
                     logger.debug(f"Verified: {file_name}")
-                elif source_file.exists():
+                elif source_stat:
                     logger.error(f"Missing backup file: {file_name}")
                     verification_results.append(False)
             
             # Update metadata with verification status
             metadata_file = backup_path / "backup_info.json"
-            if metadata_file.exists():
+            if metadata is None and metadata_file.exists():
                 with open(metadata_file, 'r', encoding='utf-8') as f:
                     metadata = json.load(f)
+            if metadata is not None:
                 metadata["integrity_verified"] = all(verification_results)
                 metadata["verification_timestamp"] = datetime.datetime.now()
                 with open(metadata_file, 'w', encoding='utf-8') as f:
@@ -344,9 +363,10 @@ class BackupIntegration:
                 "newest_backup": None
             }
             
-            if self.marker_file.exists():
+            marker_stat = _stat_or_none(self.marker_file)
+            if marker_stat is not None:
                 last_backup_time = datetime.datetime.fromtimestamp(
-                    self.marker_file.stat().st_mtime
+                    marker_stat.st_mtime
                 )
                 status["last_backup"] = last_backup_time.isoformat()
                 status["minutes_since_backup"] = (
@@ -415,13 +435,20 @@ class BackupIntegration:
 
     def _get_directory_size(self, path: Path) -> int:
         """Calculate total size of directory in bytes."""
+        # Iterative scandir walk: DirEntry caches the type from readdir, so
+        # each file costs one stat instead of rglob's is_file() + stat()
         total = 0
-        try:
-            for file_path in path.rglob('*'):
-                if file_path.is_file():
-                    total += file_path.stat().st_size
-        except Exception:
-            pass
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+            except OSError:
+                continue
         return total
 
 
@@ -58,12 +58,36 @@ done
 # Set default message if none provided
 CHECKPOINT_MESSAGE="${CHECKPOINT_MESSAGE:-Manual checkpoint}"
 
-# Capture current working state
-CURRENT_BRANCH=$(git branch --show-current 2>/dev/null || echo "unknown")
-GIT_STATUS=$(git status --porcelain 2>/dev/null | wc -l | tr -d ' ')
+# Fail fast, before any git work, when there is no session file to update
+if [ ! -f "$SESSION_FILE" ]; then
+    echo "❌ Error: SESSION_CONTINUITY.md not found at $SESSION_FILE"
+    exit 1
+fi
+
+# Capture current working state with a single git invocation
+# (--branch prefixes the file entries with a "## <branch>...<upstream>" line)
+CURRENT_BRANCH="unknown"
+CHANGED_ENTRIES=""
+if GIT_STATE=$(git status --porcelain --branch 2>/dev/null); then
+    BRANCH_LINE="${GIT_STATE%%$'\n'*}"
+    CURRENT_BRANCH="${BRANCH_LINE#\#\# }"
+    CURRENT_BRANCH="${CURRENT_BRANCH#No commits yet on }"
+    CURRENT_BRANCH="${CURRENT_BRANCH#Initial commit on }"
+    CURRENT_BRANCH="${CURRENT_BRANCH%%...*}"
+    if [ "$CURRENT_BRANCH" = "HEAD (no branch)" ]; then
+        CURRENT_BRANCH=""
+    fi
+    if [[ "$GIT_STATE" == *$'\n'* ]]; then
+        CHANGED_ENTRIES="${GIT_STATE#*$'\n'}"
+    fi
+fi
+GIT_STATUS=0
+if [ -n "$CHANGED_ENTRIES" ]; then
+    GIT_STATUS=$(wc -l <<< "$CHANGED_ENTRIES" | tr -d ' ')
+fi
 MODIFIED_FILES=""
 if [ "$GIT_STATUS" -gt 0 ]; then
-    MODIFIED_FILES=$(git status --porcelain 2>/dev/null | head -5 | sed 's/^/  - /')
+    MODIFIED_FILES=$(head -5 <<< "$CHANGED_ENTRIES" | sed 's/^/  - /')
 fi
 
 # Create checkpoint entry with save mode info
@@ -136,8 +160,16 @@ if [ -f "$SESSION_FILE" ]; then
             if [ "$GIT_STATUS" -gt 0 ]; then
                 echo ""
                 echo "💾 Saving changes to git stash..."
+                # Compare the top-of-stash SHA (one built-in call) to see
+                # whether push actually recorded a new stash entry
+                STASH_BEFORE=$(git rev-parse --verify --quiet refs/stash)
                 if git stash push -m "Checkpoint: $CHECKPOINT_MESSAGE - $READABLE_TIME"; then
-                    echo "✅ Changes saved to git stash"
+                    STASH_AFTER=$(git rev-parse --verify --quiet refs/stash)
+                    if [ "$STASH_AFTER" != "$STASH_BEFORE" ]; then
+                        echo "✅ Changes saved to git stash"
+                    else
+                        echo "ℹ️  No tracked changes to stash (untracked files are left in place)"
+                    fi
                 else
                     echo "❌ Error: Failed to create git stash"
                     exit 1
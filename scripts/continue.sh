@@ -61,21 +61,25 @@ restore_context() {
     echo
     
     if [[ -f "$SESSION_CONTINUITY_FILE" ]]; then
+        # Read the file once; every check below works on this copy
+        local session_content
+        session_content=$(<"$SESSION_CONTINUITY_FILE")
+        
         echo -e "${CYAN}📊 Recent Major Completions:${NC}"
-        grep -E "^## .* COMPLETE ✅" "$SESSION_CONTINUITY_FILE" | tail -5 | while read -r line; do
+        grep -E "^## .* COMPLETE ✅" <<< "$session_content" | tail -5 | while read -r line; do
             completion=$(echo "$line" | sed 's/^## //' | sed 's/ COMPLETE ✅.*//')
             echo -e "  ${GREEN}✅${NC} $completion"
         done
         echo
         
         # Show last status update
-        current_session=$(grep -E "^## Current Session" "$SESSION_CONTINUITY_FILE" | tail -1)
+        current_session=$(grep -E "^## Current Session" <<< "$session_content" | tail -1)
         if [[ -n "$current_session" ]]; then
             echo -e "${CYAN}📋 Last Session Status:${NC}"
             echo -e "  ${YELLOW}→${NC} $(echo "$current_session" | sed 's/^## Current Session - //')"
             
             # Get context after the last current session
-            latest_context=$(sed -n '/^## Current Session/,$p' "$SESSION_CONTINUITY_FILE" | tail -n +2 | head -3 | grep -E "^\*.*\*$" | tail -1)
+            latest_context=$(sed -n '/^## Current Session/,$p' <<< "$session_content" | tail -n +2 | head -3 | grep -E "^\*.*\*$" | tail -1)
             if [[ -n "$latest_context" ]]; then
                 echo -e "  ${YELLOW}→${NC} $(echo "$latest_context" | sed 's/^\*//' | sed 's/\*$//')"
             fi
@@ -84,14 +88,14 @@ restore_context() {
         
         # Show system performance
         echo -e "${CYAN}⚡ System Performance:${NC}"
-        if grep -q "97.8% token reduction" "$SESSION_CONTINUITY_FILE"; then
+        if [[ "$session_content" == *"97.8% token reduction"* ]]; then
             echo -e "  ${GREEN}🎯${NC} Token Optimization: 97.8% reduction (24,600 → 540 tokens)"
         fi
-        if grep -q "Boot Time" "$SESSION_CONTINUITY_FILE"; then
-            boot_time=$(grep -E "Boot Time.*:" "$SESSION_CONTINUITY_FILE" | tail -1 | sed 's/.*Boot Time[^:]*: *//' | sed 's/ .*//')
+        if [[ "$session_content" == *"Boot Time"* ]]; then
+            boot_time=$(grep -E "Boot Time.*:" <<< "$session_content" | tail -1 | sed 's/.*Boot Time[^:]*: *//' | sed 's/ .*//')
             echo -e "  ${GREEN}🚀${NC} Boot Performance: $boot_time"
         fi
-        if grep -q "88% improvement" "$SESSION_CONTINUITY_FILE"; then
+        if [[ "$session_content" == *"88% improvement"* ]]; then
             echo -e "  ${GREEN}🏆${NC} Overall Improvement: 88%+ (target exceeded)"
         fi
         echo
@@ -16,9 +16,10 @@ get_timestamp() {
 get_project_status() {
     local status=""
     
-    # Check if we're in a git repo and get status
-    if git -C "$PROJECT_ROOT" status >/dev/null 2>&1; then
-        local git_status=$(git -C "$PROJECT_ROOT" status --porcelain 2>/dev/null)
+    # Check if we're in a git repo and get status (one status run; its exit
+    # code doubles as the repository check)
+    local git_status
+    if git_status=$(git -C "$PROJECT_ROOT" status --porcelain 2>/dev/null); then
         if [ -n "$git_status" ]; then
             status="Git: Uncommitted changes present"
         else
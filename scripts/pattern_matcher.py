@@ -9,11 +9,112 @@ Created for: Christian
 import os
 import re
 import json
+import functools
+import heapq
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 from collections import Counter
 import time
 
+# Keyword separators: every character that is neither a word char nor whitespace.
+# ASCII text goes through a translate table built from the same class in one
+# C-level pass; anything else falls back to the regex so Unicode punctuation
+# (curly quotes, dashes, box drawing) still splits tokens.
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_TOKEN_SEPARATORS = ''.join(c for c in map(chr, range(128)) if _NON_WORD_RE.match(c))
+_TOKEN_TABLE = str.maketrans(_TOKEN_SEPARATORS, ' ' * len(_TOKEN_SEPARATORS))
+
+def _split_tokens(text: str) -> List[str]:
+    """Lowercase text and split it on whitespace and non-word characters"""
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_TOKEN_TABLE).split()
+    return _NON_WORD_RE.sub(' ', text).split()
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
+})
+
+# Checked in order: the first level with a matching indicator wins
+COMPLEXITY_INDICATORS = (
+    ('high', ('integration', 'architecture', 'multiple', 'complex', 'advanced')),
+    ('medium', ('configuration', 'optimization', 'workflow', 'system')),
+    ('low', ('simple', 'basic', 'quick', 'easy')),
+)
+
+# Auto-generated tags and the words that trigger them (substring match)
+TAG_TRIGGER_WORDS = (
+    ('boot', ('boot', 'startup', 'initialization')),
+    ('performance', ('performance', 'optimization', 'speed', 'faster')),
+    ('debugging', ('error', 'bug', 'fix', 'issue')),
+    ('session', ('session', 'continuity', 'memory')),
+    ('agents', ('agent', 'parallel', 'configuration')),
+    ('backup', ('backup', 'restore', 'archive')),
+    ('tokens', ('token', 'reduction', 'usage')),
+    ('caching', ('cache', 'caching', 'state')),
+)
+_TAG_BY_WORD = {word: tag for tag, words in TAG_TRIGGER_WORDS for word in words}
+# One scan for every trigger word; the lookahead tests each position so
+# overlapping words are all found, matching the per-word "in" semantics
+_TAG_TRIGGER_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_TAG_BY_WORD, key=len, reverse=True))) + '))'
+)
+
+# Metadata fields, compiled once instead of per pattern file
+TITLE_RE = re.compile(r'^#\s*(?:Pattern:\s*)?(.+)', re.MULTILINE)
+KEYWORDS_RE = re.compile(r'\*\*Keywords\*\*:\s*(.+)')
+TAGS_RE = re.compile(r'\*\*Tags\*\*:\s*(.+)')
+COMPLEXITY_RE = re.compile(r'\*\*Complexity\*\*:\s*(.+)')
+USE_CASES_RE = re.compile(r'\*\*Use Cases\*\*:\s*(.+)')
+
+# Section bodies run from their heading to the next "##" heading or "---" rule
+PROBLEM_HEADING_RE = re.compile(r'## Problem\s*\n')
+SOLUTION_HEADING_RE = re.compile(r'## Solution\s*\n')
+SECTION_TERMINATORS = ('\n##', '\n---')
+
+def _extract_section(content: str, heading_re: re.Pattern) -> str:
+    """Return the stripped body following a section heading, or "" if absent"""
+    heading = heading_re.search(content)
+    if not heading:
+        return ""
+    
+    start = heading.end()
+    end = len(content)
+    for terminator in SECTION_TERMINATORS:
+        position = content.find(terminator, start)
+        if position != -1 and position < end:
+            end = position
+    return content[start:end].strip()
+
+def _prefetch_files(paths: List[str]):
+    """Hint the kernel to read files ahead of parsing (no-op where posix_fadvise is unavailable)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+@functools.lru_cache(maxsize=1024)
+def _normalized_terms(terms: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased term set, memoized because index keywords repeat across every query"""
+    # Plain memoization rather than JIT compilation: this is string work, not numeric loops
+    return frozenset(term.lower() for term in terms)
+
+# Persisted metadata cache format; bump whenever _extract_pattern_metadata or
+# _generate_tags changes what they produce, so stale entries are discarded
+INDEX_CACHE_VERSION = 1
+
 class PatternMatcher:
     """
     Intelligent pattern matching system that analyzes problem descriptions
@@ -23,14 +124,11 @@ class PatternMatcher:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.patterns_dir = self.project_root / "patterns"
+        # Kept with the project's other memory state (not written if memory/ is absent)
+        self.index_cache_file = self.project_root / "memory" / "pattern_index_cache.json"
         self.pattern_index = {}
         self.pattern_metadata = {}
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
-        }
+        self.stop_words = STOP_WORDS
         
         # Load pattern index
         self._build_pattern_index()
@@ -46,18 +144,79 @@ class PatternMatcher:
                 for pattern_file in category_path.glob("*.md"):
                     pattern_files.append((category, pattern_file))
         
+        # Metadata from previous runs, keyed by file path
+        cached_index = self._load_index_cache()
+        fresh_index = {}
+        
+        # Current (mtime_ns, size) signature of each pattern file
+        signatures = {}
+        for _, pattern_file in pattern_files:
+            try:
+                stat_result = pattern_file.stat()
+                signatures[str(pattern_file)] = [stat_result.st_mtime_ns, stat_result.st_size]
+            except OSError:
+                signatures[str(pattern_file)] = None
+        
+        def is_cached(file_key: str) -> bool:
+            cached_entry = cached_index.get(file_key)
+            return bool(signatures[file_key] and cached_entry
+                        and cached_entry['signature'] == signatures[file_key])
+        
+        # Start kernel readahead for every file that has to be parsed again
+        _prefetch_files([file_key for file_key in signatures if not is_cached(file_key)])
+        
         # Process each pattern file
         for category, pattern_file in pattern_files:
             pattern_name = pattern_file.stem
             pattern_key = f"{category}/{pattern_name}"
+            file_key = str(pattern_file)
+            signature = signatures[file_key]
             
-            # Extract metadata from pattern file
-            metadata = self._extract_pattern_metadata(pattern_file, category)
+            # Reuse cached metadata while the file is unchanged
+            if is_cached(file_key):
+                metadata = cached_index[file_key]['metadata']
+            else:
+                metadata = self._extract_pattern_metadata(pattern_file, category)
+            
+            if signature:
+                fresh_index[file_key] = {'signature': signature, 'metadata': metadata}
             self.pattern_metadata[pattern_key] = metadata
             
             # Build searchable keywords
             keywords = self._extract_keywords(metadata)
-            self.pattern_index[pattern_key] = keywords
+            self.pattern_index[pattern_key] = tuple(keywords)
+        
+        if fresh_index != cached_index:
+            self._save_index_cache(fresh_index)
+    
+    def _load_index_cache(self) -> Dict:
+        """Load persisted pattern metadata, or an empty cache if unavailable or from another version"""
+        try:
+            with open(self.index_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(cache, dict) or cache.get('version') != INDEX_CACHE_VERSION:
+            return {}
+        entries = cache.get('entries')
+        if not isinstance(entries, dict):
+            return {}
+        
+        # Drop malformed entries instead of failing on them later
+        return {
+            file_key: entry for file_key, entry in entries.items()
+            if isinstance(entry, dict) and isinstance(entry.get('metadata'), dict)
+            and 'signature' in entry
+        }
+    
+    def _save_index_cache(self, cache: Dict):
+        """Persist pattern metadata for the next run (best effort)"""
+        try:
+            with open(self.index_cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_CACHE_VERSION, 'entries': cache}, f)
+        except OSError:
+            pass
     
     def _extract_pattern_metadata(self, pattern_file: Path, category: str) -> Dict:
         """Extract metadata from pattern markdown file"""
@@ -65,29 +224,27 @@ class PatternMatcher:
             content = pattern_file.read_text()
             
             # Extract title
-            title_match = re.search(r'^#\s*(?:Pattern:\s*)?(.+)', content, re.MULTILINE)
+            title_match = TITLE_RE.search(content)
             title = title_match.group(1).strip() if title_match else pattern_file.stem
             
             # Extract explicit metadata if present
-            keywords_match = re.search(r'\*\*Keywords\*\*:\s*(.+)', content)
+            keywords_match = KEYWORDS_RE.search(content)
             explicit_keywords = keywords_match.group(1).split(', ') if keywords_match else []
             
-            tags_match = re.search(r'\*\*Tags\*\*:\s*(.+)', content)
+            tags_match = TAGS_RE.search(content)
             explicit_tags = tags_match.group(1).split(', ') if tags_match else []
             
-            complexity_match = re.search(r'\*\*Complexity\*\*:\s*(.+)', content)
+            complexity_match = COMPLEXITY_RE.search(content)
             explicit_complexity = complexity_match.group(1).strip() if complexity_match else None
             
-            use_cases_match = re.search(r'\*\*Use Cases\*\*:\s*(.+)', content)
+            use_cases_match = USE_CASES_RE.search(content)
             use_cases = use_cases_match.group(1).split(', ') if use_cases_match else []
             
             # Extract problem section
-            problem_match = re.search(r'## Problem\s*\n(.*?)(?=\n##|\n---|\Z)', content, re.DOTALL)
-            problem = problem_match.group(1).strip() if problem_match else ""
+            problem = _extract_section(content, PROBLEM_HEADING_RE)
             
             # Extract solution section
-            solution_match = re.search(r'## Solution\s*\n(.*?)(?=\n##|\n---|\Z)', content, re.DOTALL)
-            solution = solution_match.group(1).strip() if solution_match else ""
+            solution = _extract_section(content, SOLUTION_HEADING_RE)
             
             # Combine explicit and auto-generated tags
             auto_tags = self._generate_tags(title, problem, solution, category)
@@ -124,42 +281,21 @@ class PatternMatcher:
     def _generate_tags(self, title: str, problem: str, solution: str, category: str) -> List[str]:
         """Auto-generate relevant tags from content"""
         text = f"{title} {problem} {solution}".lower()
-        tags = [category]
-        
-        # Technical domain tags
-        if any(word in text for word in ['boot', 'startup', 'initialization']):
-            tags.append('boot')
-        if any(word in text for word in ['performance', 'optimization', 'speed', 'faster']):
-            tags.append('performance')
-        if any(word in text for word in ['error', 'bug', 'fix', 'issue']):
-            tags.append('debugging')
-        if any(word in text for word in ['session', 'continuity', 'memory']):
-            tags.append('session')
-        if any(word in text for word in ['agent', 'parallel', 'configuration']):
-            tags.append('agents')
-        if any(word in text for word in ['backup', 'restore', 'archive']):
-            tags.append('backup')
-        if any(word in text for word in ['token', 'reduction', 'usage']):
-            tags.append('tokens')
-        if any(word in text for word in ['cache', 'caching', 'state']):
-            tags.append('caching')
-        
-        return list(set(tags))
+        tags = {category}
+        
+        # Technical domain tags, all trigger words found in a single pass
+        tags.update(_TAG_BY_WORD[match.group(1)] for match in _TAG_TRIGGER_RE.finditer(text))
+        
+        return list(tags)
     
     def _assess_complexity(self, solution: str) -> str:
         """Assess pattern complexity based on solution content"""
         if not solution:
             return 'low'
         
-        complexity_indicators = {
-            'high': ['integration', 'architecture', 'multiple', 'complex', 'advanced'],
-            'medium': ['configuration', 'optimization', 'workflow', 'system'],
-            'low': ['simple', 'basic', 'quick', 'easy']
-        }
-        
         solution_lower = solution.lower()
         
-        for level, indicators in complexity_indicators.items():
+        for level, indicators in COMPLEXITY_INDICATORS:
             if any(indicator in solution_lower for indicator in indicators):
                 return level
         
@@ -174,8 +310,7 @@ class PatternMatcher:
     def _extract_content_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text content"""
         # Clean and tokenize
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        words = text.split()
+        words = _split_tokens(text)
         
         # Remove stop words and short words
         keywords = [word for word in words 
@@ -221,39 +356,45 @@ class PatternMatcher:
         problem_keywords = self._extract_content_keywords(problem_description)
         problem_tags = self._generate_tags("", problem_description, "", "")
         
-        search_terms = problem_keywords + problem_tags
+        search_terms = tuple(problem_keywords + problem_tags)
         
         # Score each pattern
-        pattern_scores = []
+        scored_keys = []
         
         for pattern_key, pattern_keywords in self.pattern_index.items():
             score = self._calculate_match_score(search_terms, pattern_keywords, pattern_key)
             
             if score > 0:
-                metadata = self.pattern_metadata[pattern_key]
-                pattern_scores.append({
-                    'pattern_key': pattern_key,
-                    'title': metadata['title'],
-                    'category': metadata['category'],
-                    'score': score,
-                    'confidence': min(score * 10, 100),  # Convert to percentage
-                    'complexity': metadata['complexity'],
-                    'tags': metadata['tags'],
-                    'file_path': metadata['file_path'],
-                    'problem': metadata['problem'][:200] + "..." if len(metadata['problem']) > 200 else metadata['problem']
-                })
-        
-        # Sort by score and return top matches
-        pattern_scores.sort(key=lambda x: x['score'], reverse=True)
-        return pattern_scores[:max_results]
+                scored_keys.append((score, pattern_key))
+        
+        # Keep only the top matches (same order as a stable descending sort),
+        # then build result entries for those alone
+        top_matches = heapq.nlargest(max_results, scored_keys, key=lambda item: item[0])
+        
+        pattern_scores = []
+        for score, pattern_key in top_matches:
+            metadata = self.pattern_metadata[pattern_key]
+            pattern_scores.append({
+                'pattern_key': pattern_key,
+                'title': metadata['title'],
+                'category': metadata['category'],
+                'score': score,
+                'confidence': min(score * 10, 100),  # Convert to percentage
+                'complexity': metadata['complexity'],
+                'tags': metadata['tags'],
+                'file_path': metadata['file_path'],
+                'problem': metadata['problem'][:200] + "..." if len(metadata['problem']) > 200 else metadata['problem']
+            })
+        
+        return pattern_scores
     
     def _calculate_match_score(self, search_terms: List[str], pattern_keywords: List[str], pattern_key: str) -> float:
         """Calculate match score between search terms and pattern keywords"""
         if not search_terms or not pattern_keywords:
             return 0.0
         
-        search_set = set(term.lower() for term in search_terms)
-        pattern_set = set(keyword.lower() for keyword in pattern_keywords)
+        search_set = _normalized_terms(tuple(search_terms))
+        pattern_set = _normalized_terms(tuple(pattern_keywords))
         
         # Calculate intersection ratio
         intersection = search_set.intersection(pattern_set)
@@ -307,6 +448,12 @@ class PatternMatcher:
 
 def main():
     """Test the pattern matcher with sample problems"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Pattern Matching Engine Test")
+    parser.add_argument("--benchmark", action="store_true", help="Report search timings")
+    args = parser.parse_args()
+    
     matcher = PatternMatcher()
     
     print("🔍 Pattern Matching Engine Test")
@@ -332,9 +479,11 @@ def main():
         print(f"🔍 Test {i}: {problem}")
         print("-" * 40)
         
-        start_time = time.time()
+        if args.benchmark:
+            start_ns = time.perf_counter_ns()
         matches = matcher.match_patterns(problem, max_results=3)
-        end_time = time.time()
+        if args.benchmark:
+            end_ns = time.perf_counter_ns()
         
         if matches:
             for j, match in enumerate(matches, 1):
@@ -347,8 +496,9 @@ def main():
             print("  No matching patterns found")
             print()
         
-        print(f"  ⚡ Search time: {(end_time - start_time)*1000:.1f}ms")
-        print()
+        if args.benchmark:
+            print(f"  ⚡ Search time: {(end_ns - start_ns) / 1_000_000:.1f}ms")
+            print()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,9 +12,13 @@ Purpose: Unify pattern matching, execution, learning, and context management
 """
 
 import os
+import re
 import json
 import time
+import asyncio
 import hashlib
+import signal
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -24,9 +28,11 @@ import logging
 
 # Import existing components
 import sys
-sys.path.append(str(Path(__file__).parent))
+SCRIPTS_DIR = str(Path(__file__).parent)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
 from pattern_matcher import PatternMatcher
-from session_state_manager import SessionStateManager, SmartConfigurationManager
+from session_state_manager import get_configuration_manager
 
 # Auto-learning integration
 try:
@@ -35,6 +41,92 @@ try:
 except ImportError:
     LEARNING_ENABLED = False
 
+# Code block languages the executor accepts, and the subset run through the shell
+EXECUTABLE_LANGUAGES = frozenset({'bash', 'shell', 'python', 'javascript'})
+SHELL_LANGUAGES = frozenset({'bash', 'shell'})
+
+# Command fragments that block a bash step from running
+UNSAFE_BASH_PATTERNS = (
+    'rm -rf', 'sudo', 'chmod 777', '> /dev/null', 'curl http',
+    'wget http', 'dd if=', 'mkfs', 'fdisk', 'format'
+)
+_UNSAFE_BASH_RE = re.compile('|'.join(map(re.escape, UNSAFE_BASH_PATTERNS)), re.IGNORECASE)
+
+# Pattern markdown step extraction, compiled once instead of per execution
+CODE_BLOCK_RE = re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL)
+NUMBERED_STEP_RE = re.compile(r'^\d+\.\s+(.+?)(?=\n\d+\.|\n#|\Z)', re.MULTILINE | re.DOTALL)
+
+# Hard limits for bash pattern steps
+STEP_TIMEOUT_SECONDS = 30
+MAX_STEP_OUTPUT_BYTES = 1024 * 1024
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Seconds since a time.perf_counter_ns() reading (monotonic, unaffected by clock changes)"""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000_000
+
+@functools.lru_cache(maxsize=128)
+def _read_pattern_text(path: str, mtime_ns: int, size: int) -> str:
+    """Read a pattern file, memoized on its stat signature so repeat executions skip the read"""
+    return Path(path).read_text()
+
+async def _read_bounded(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """Drain a stream, keeping at most limit bytes"""
+    data = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        if len(data) < limit:
+            data.extend(chunk[:limit - len(data)])
+    return bytes(data)
+
+def _kill_process_group(proc: asyncio.subprocess.Process):
+    """SIGKILL a step's shell and everything it started; no-op once the group is gone"""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            # No process groups (Windows): kill the shell itself
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+async def _run_shell_step(command: str, cwd: Path, timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run a shell command with a hard deadline and bounded output capture.
+    
+    On POSIX the shell leads its own process group, so a timeout kills any
+    background children still holding the output pipes open. Drive this with asyncio.run()
+    from synchronous code only; it cannot be started inside a running event loop.
+    """
+    proc = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        start_new_session=True
+    )
+    
+    async def _communicate():
+        out, err = await asyncio.gather(
+            _read_bounded(proc.stdout, MAX_STEP_OUTPUT_BYTES),
+            _read_bounded(proc.stderr, MAX_STEP_OUTPUT_BYTES)
+        )
+        return out, err, await proc.wait()
+    
+    try:
+        stdout, stderr, returncode = await asyncio.wait_for(_communicate(), timeout)
+    except asyncio.TimeoutError:
+        _kill_process_group(proc)
+        await proc.wait()
+        raise subprocess.TimeoutExpired(command, timeout)
+    
+    return subprocess.CompletedProcess(
+        command, returncode,
+        stdout.decode(errors='replace'),
+        stderr.decode(errors='replace')
+    )
+
 @dataclass
 class PatternExecutionResult:
     """Result of pattern execution"""
@@ -79,15 +171,19 @@ class PatternExecutor:
         
     def execute_pattern(self, pattern_key: str, context: Dict[str, Any]) -> PatternExecutionResult:
         """Execute a pattern with full monitoring and capture"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Load pattern details
             pattern_file = self._get_pattern_file(pattern_key)
-            if not pattern_file.exists():
+            try:
+                stat_result = pattern_file.stat()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Pattern file not found: {pattern_file}")
             
-            pattern_content = pattern_file.read_text()
+            pattern_content = _read_pattern_text(
+                str(pattern_file), stat_result.st_mtime_ns, stat_result.st_size
+            )
             
             # Extract executable components
             executable_steps = self._extract_executable_steps(pattern_content)
@@ -115,7 +211,7 @@ class PatternExecutor:
                 pattern_key, context, output_lines, errors
             )
             
-            execution_time = time.time() - start_time
+            execution_time = _elapsed_seconds(start_ns)
             success = len(errors) == 0
             
             result = PatternExecutionResult(
@@ -133,7 +229,7 @@ class PatternExecutor:
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = _elapsed_seconds(start_ns)
             return PatternExecutionResult(
                 pattern_key=pattern_key,
                 success=False,
@@ -152,15 +248,13 @@ class PatternExecutor:
     
     def _extract_executable_steps(self, pattern_content: str) -> List[Dict[str, Any]]:
         """Extract executable steps from pattern markdown"""
-        import re
-        
         steps = []
         
         # Find code blocks with execution hints
-        code_blocks = re.findall(r'```(\w+)?\n(.*?)\n```', pattern_content, re.DOTALL)
+        code_blocks = CODE_BLOCK_RE.findall(pattern_content)
         
         for lang, code in code_blocks:
-            if lang in ['bash', 'shell', 'python', 'javascript']:
+            if lang in EXECUTABLE_LANGUAGES:
                 steps.append({
                     'type': 'code',
                     'language': lang,
@@ -168,7 +262,7 @@ class PatternExecutor:
                 })
         
         # Find explicit step instructions
-        step_matches = re.findall(r'^\d+\.\s+(.+?)(?=\n\d+\.|\n#|\Z)', pattern_content, re.MULTILINE | re.DOTALL)
+        step_matches = NUMBERED_STEP_RE.findall(pattern_content)
         
         for step_text in step_matches:
             steps.append({
@@ -193,18 +287,17 @@ class PatternExecutor:
         side_effects = []
         
         try:
-            if step['language'] in ['bash', 'shell']:
+            if step['language'] in SHELL_LANGUAGES:
                 # Execute bash commands with safety checks
                 safe_commands = self._validate_bash_safety(step['content'])
                 if safe_commands:
-                    result = subprocess.run(
-                        step['content'], 
-                        shell=True, 
-                        capture_output=True, 
-                        text=True,
-                        cwd=self.project_root,
-                        timeout=30
-                    )
+                    # Synchronous entry point: asyncio.run() raises RuntimeError
+                    # if this executor is called from inside a running event loop
+                    result = asyncio.run(_run_shell_step(
+                        step['content'],
+                        self.project_root,
+                        STEP_TIMEOUT_SECONDS
+                    ))
                     output.append(result.stdout)
                     if result.stderr:
                         output.append(f"STDERR: {result.stderr}")
@@ -299,13 +392,7 @@ class PatternExecutor:
     
     def _validate_bash_safety(self, command: str) -> bool:
         """Validate bash command safety"""
-        unsafe_patterns = [
-            'rm -rf', 'sudo', 'chmod 777', '> /dev/null', 'curl http',
-            'wget http', 'dd if=', 'mkfs', 'fdisk', 'format'
-        ]
-        
-        command_lower = command.lower()
-        return not any(pattern in command_lower for pattern in unsafe_patterns)
+        return _UNSAFE_BASH_RE.search(command) is None
     
     def _capture_execution_insights(self, pattern_key: str, context: Dict[str, Any], 
                                   output: List[str], errors: List[str]) -> List[str]:
@@ -535,9 +622,10 @@ class PatternSystemOrchestrator:
         self.learning_capturer = LearningCapturer(project_root)
         self.context_engine = ContextEngine(project_root)
         
-        # Session and caching integration
-        self.session_manager = SessionStateManager(project_root)
-        self.config_manager = SmartConfigurationManager(project_root)
+        # Session and caching integration (shared per project root; the
+        # configuration manager already owns a session manager for it)
+        self.config_manager = get_configuration_manager(project_root)
+        self.session_manager = self.config_manager.session_manager
         
         # Auto-learning integration
         self.learning_integration = None
@@ -587,7 +675,7 @@ class PatternSystemOrchestrator:
         Returns:
             Complete solution report with patterns, execution results, and learning
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         self.logger.info(f"Solving problem: {problem_description[:100]}...")
         
@@ -602,7 +690,7 @@ class PatternSystemOrchestrator:
                     'patterns': [],
                     'execution_results': [],
                     'learning_captures': [],
-                    'total_time': time.time() - start_time
+                    'total_time': _elapsed_seconds(start_ns)
                 }
             
             # Step 2: Pattern Execution (if requested)
@@ -648,7 +736,7 @@ class PatternSystemOrchestrator:
                 self.operation_metrics['learning_captures'] += 1
             
             # Step 3: Update performance metrics
-            total_time = time.time() - start_time
+            total_time = _elapsed_seconds(start_ns)
             self.operation_metrics['total_execution_time'] += total_time
             
             # Step 4: Update session cache
@@ -687,7 +775,7 @@ class PatternSystemOrchestrator:
                 'patterns': [],
                 'execution_results': [],
                 'learning_captures': [],
-                'total_time': time.time() - start_time
+                'total_time': _elapsed_seconds(start_ns)
             }
     
     def _match_patterns_cached(self, problem_description: str, max_patterns: int) -> List[Dict[str, Any]]:
@@ -845,13 +933,27 @@ class PatternSystemOrchestrator:
         except Exception as e:
             self.logger.error(f"Cache cleanup failed: {e}")
 
+@functools.lru_cache(maxsize=8)
+def _cached_orchestrator(resolved_root: str) -> PatternSystemOrchestrator:
+    """
+    Build one PatternSystemOrchestrator per resolved project root
+    The pattern index is built once per instance: call
+    _cached_orchestrator.cache_clear() after adding or editing pattern files
+    so the next call rebuilds it (cleanup_pattern_caches() does this too)
+    """
+    return PatternSystemOrchestrator(resolved_root)
+
+def _get_orchestrator(project_root: str = ".") -> PatternSystemOrchestrator:
+    """Return the shared orchestrator for project_root"""
+    return _cached_orchestrator(str(Path(project_root).resolve()))
+
 # Convenience functions for integration with existing CLAUDE.md
 def quick_pattern_solve(problem_description: str, execute: bool = False) -> Dict[str, Any]:
     """
     Quick pattern-based problem solving
     Use this as the primary interface for pattern operations
     """
-    orchestrator = PatternSystemOrchestrator()
+    orchestrator = _get_orchestrator()
     return orchestrator.solve_problem(problem_description, execute_best=execute)
 
 def get_pattern_system_status() -> Dict[str, Any]:
@@ -859,7 +961,7 @@ def get_pattern_system_status() -> Dict[str, Any]:
     Get pattern system status
     Use this for health checks and debugging
     """
-    orchestrator = PatternSystemOrchestrator()
+    orchestrator = _get_orchestrator()
     return orchestrator.get_system_status()
 
 def cleanup_pattern_caches():
@@ -867,8 +969,10 @@ def cleanup_pattern_caches():
     Cleanup pattern system caches
     Use this for maintenance operations
     """
-    orchestrator = PatternSystemOrchestrator()
+    orchestrator = _get_orchestrator()
     orchestrator.cleanup_caches()
+    # Drop shared orchestrators so the next call re-indexes patterns from disk
+    _cached_orchestrator.cache_clear()
 
 @contextmanager
 def pattern_operation_context(problem_description: str):
@@ -10,8 +10,98 @@ Following: Section 5 - PROJECT HIERARCHY AND CONTEXT MANAGEMENT SYSTEM
 import os
 import re
 import json
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+# Fast JSON serialization for the results file when orjson is available
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    ORJSON_ENABLED = False
+
+# Reject oversized CLAUDE.md files before any pattern matching runs
+MAX_CLAUDE_MD_SIZE = 10 * 1024 * 1024
+
+REQUIRED_SECTIONS = (
+    "BINDING ENFORCEMENT PROTOCOL",
+    "CRITICAL BINDING STATEMENTS",
+    "ENFORCEMENT MECHANISMS"
+)
+
+# Validation and extraction patterns, compiled once at import
+MARKDOWN_HEADER_RE = re.compile(r'^#\s+', re.MULTILINE)
+REQUIRED_SECTIONS_RE = re.compile('|'.join(map(re.escape, REQUIRED_SECTIONS)))
+DANGEROUS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'rm\s+-rf\s+/',
+    r'sudo\s+rm',
+    r'eval\s*\(',
+    r'exec\s*\(',
+    r'__import__\s*\(',
+    r'subprocess\.call\s*\([^)]*shell\s*=\s*True'
+))
+# Single-pass screen over all dangerous patterns; clean files never hit the per-pattern loop
+DANGEROUS_ANY_RE = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern in DANGEROUS_PATTERNS),
+    re.IGNORECASE
+)
+AGENT_COUNT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(\d+)\s*agents?",
+    r"Deploy\s+(\d+)",
+    r"(\d+)-agent"
+))
+DIRECTIVE_RE = re.compile(r"Directive\s+(\d+)", re.IGNORECASE)
+BINDING_SECTION_RE = re.compile(
+    r"CRITICAL BINDING STATEMENTS:(.*?)(?=###|$)",
+    re.DOTALL | re.IGNORECASE
+)
+NUMBERED_RULE_RE = re.compile(r"\d+\.\s*\*\*(.*?)\*\*")
+# Case-insensitive keywords read by the _extract_* helpers
+CONFIG_KEYWORDS = (
+    "test-first development", "tdd", "parallel", "sequential",
+    "pattern", "before", "clean code", "test coverage"
+)
+# Per-check success lines only print in verbose mode (--verbose or
+# CLAUDE_LOADER_VERBOSE=1); warnings, errors and summaries always print
+VERBOSE = os.environ.get("CLAUDE_LOADER_VERBOSE", "0") == "1"
+
+def _verbose_print(*args, **kwargs):
+    """print() for per-check detail lines, skipped unless VERBOSE is set"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+def _read_git_branch(git_dir: Path) -> Optional[str]:
+    """Current branch from .git/HEAD without spawning git; "" when detached, None if unreadable"""
+    try:
+        with open(git_dir / "HEAD", 'r', encoding='utf-8') as f:
+            head = f.readline().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    if head.startswith("ref: "):
+        return None
+    return ""
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize results to indented JSON bytes, stringifying unknown types"""
+    if ORJSON_ENABLED:
+        return orjson.dumps(
+            data, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write bytes with raw os.write calls, skipping buffered IO"""
+    data = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 class ProjectCLAUDELoader:
     """
@@ -26,6 +116,7 @@ class ProjectCLAUDELoader:
         self.project_config = {}
         self.validation_results = {}
         self.pattern_library = {}
+        self._claude_md_cache = None  # (path, content) read during validation
         
     def find_project_root(self) -> Optional[str]:
         """
@@ -38,25 +129,29 @@ class ProjectCLAUDELoader:
         
         print("🔍 Searching for project root...")
         
+        # Directory checks are collected and printed once with the result
+        report_lines = []
+        found_dir = None
+        
         # Search up directory tree for project markers
         while str(current_dir) != "/" and depth < max_depth:
-            print(f"   Checking: {current_dir}")
+            report_lines.append(f"   Checking: {current_dir}")
             
             # Primary markers (highest confidence)
             claude_md_path = current_dir / "CLAUDE.md"
             if claude_md_path.exists():
-                print(f"✓ Found CLAUDE.md at: {current_dir}")
-                self.project_root = str(current_dir)
+                report_lines.append(f"✓ Found CLAUDE.md at: {current_dir}")
                 self.project_claude_path = str(claude_md_path)
-                return str(current_dir)
+                found_dir = current_dir
+                break
             
             # Secondary markers with Claude memory structure
             memory_dir = current_dir / "memory"
             learning_archive = memory_dir / "learning_archive.md"
             if memory_dir.exists() and learning_archive.exists():
-                print(f"✓ Found memory structure at: {current_dir}")
-                self.project_root = str(current_dir)
-                return str(current_dir)
+                report_lines.append(f"✓ Found memory structure at: {current_dir}")
+                found_dir = current_dir
+                break
             
             # Tertiary markers - common project indicators with Claude structure
             has_package_json = (current_dir / "package.json").exists()
@@ -67,18 +162,22 @@ class ProjectCLAUDELoader:
                 # Verify it also has Claude learning structure
                 session_continuity = current_dir / "SESSION_CONTINUITY.md"
                 if memory_dir.exists() or session_continuity.exists():
-                    print(f"✓ Found project indicators with Claude structure at: {current_dir}")
-                    self.project_root = str(current_dir)
-                    return str(current_dir)
+                    report_lines.append(f"✓ Found project indicators with Claude structure at: {current_dir}")
+                    found_dir = current_dir
+                    break
             
             # Move up one directory
             current_dir = current_dir.parent
             depth += 1
         
-        # No project root found - use current directory
-        print(f"ℹ️ No project root found - using current directory: {self.start_directory}")
-        self.project_root = str(self.start_directory)
-        return str(self.start_directory)
+        if found_dir is None:
+            # No project root found - use current directory
+            report_lines.append(f"ℹ️ No project root found - using current directory: {self.start_directory}")
+            found_dir = self.start_directory
+        
+        print("\n".join(report_lines))
+        self.project_root = str(found_dir)
+        return str(found_dir)
     
     def execute_project_discovery(self) -> Dict:
         """
@@ -184,17 +283,28 @@ class ProjectCLAUDELoader:
         print("")
         print("Project structure:")
         
-        code_extensions = [".py", ".js", ".ts", ".jsx", ".tsx"]
-        code_files = []
+        code_extensions = (".py", ".js", ".ts", ".jsx", ".tsx")
+        files_by_extension = {ext: [] for ext in code_extensions}
+        root_str = str(project_root_path)
+        
+        # One directory walk buckets files by extension instead of one rglob per extension
+        for dirpath, _, filenames in os.walk(root_str):
+            for name in filenames:
+                bucket = files_by_extension.get(os.path.splitext(name)[1])
+                if bucket is not None and len(bucket) < 20:  # Limit to first 20 per extension
+                    bucket.append(os.path.join(dirpath, name))
+            if len(files_by_extension[code_extensions[0]]) >= 20:
+                break  # The overall listing is already filled by the first extension
         
-        for ext in code_extensions:
-            files = list(project_root_path.rglob(f"*{ext}"))
-            code_files.extend(files[:20])  # Limit to first 20 per extension
+        code_files = [path for ext in code_extensions for path in files_by_extension[ext]]
         
+        structure_lines = []
         for file_path in code_files[:20]:  # Overall limit of 20 files
-            relative_path = file_path.relative_to(project_root_path)
-            print(f"  {relative_path}")
-            discovery_results["project_structure"].append(str(relative_path))
+            relative_path = os.path.relpath(file_path, root_str)
+            structure_lines.append(f"  {relative_path}")
+            discovery_results["project_structure"].append(relative_path)
+        if structure_lines:
+            print("\n".join(structure_lines))
         
         # Check git status
         git_dir = project_root_path / ".git"
@@ -212,17 +322,22 @@ class ProjectCLAUDELoader:
                 result = subprocess.run(['git', 'status', '--short'], 
                                       capture_output=True, text=True)
                 if result.returncode == 0:
-                    status_lines = result.stdout.strip().split('\n')
-                    for line in status_lines:
-                        if line.strip():
-                            print(f"  {line}")
+                    # splitlines() yields no spurious '' entry on a clean tree and
+                    # keeps the leading status column that strip() would eat
+                    status_lines = result.stdout.splitlines()
+                    if status_lines:
+                        print("\n".join(f"  {line}" for line in status_lines))
                     discovery_results["git_info"]["status"] = status_lines
                 
-                # Get current branch
-                result = subprocess.run(['git', 'branch', '--show-current'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    branch = result.stdout.strip()
+                # Get current branch (read HEAD directly; fall back to git
+                # for worktrees and submodules where .git is a file)
+                branch = _read_git_branch(git_dir) if git_dir.is_dir() else None
+                if branch is None:
+                    result = subprocess.run(['git', 'branch', '--show-current'], 
+                                          capture_output=True, text=True)
+                    if result.returncode == 0:
+                        branch = result.stdout.strip()
+                if branch is not None:
                     print(f"Current branch: {branch}")
                     discovery_results["git_info"]["current_branch"] = branch
                     
@@ -271,60 +386,60 @@ Dependencies: [Listed from package files]
             # Step 5.2.1: Verify File Integrity
             claude_path = Path(self.project_claude_path)
             
+            # Size gate keeps oversized input away from the regex checks below
+            file_size = claude_path.stat().st_size
+            if file_size > MAX_CLAUDE_MD_SIZE:
+                validation_results["valid"] = False
+                validation_results["issues"].append(
+                    f"File too large: {file_size} bytes (limit {MAX_CLAUDE_MD_SIZE})"
+                )
+                print(f"🚨 File exceeds {MAX_CLAUDE_MD_SIZE} byte limit - skipping checks")
+                self.validation_results = validation_results
+                return validation_results
+            
             # Check if file is readable
             with open(claude_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 validation_results["file_readable"] = True
-                print("✓ File is readable")
+                _verbose_print("✓ File is readable")
+            self._claude_md_cache = (str(claude_path), content)
             
             # Check for basic markdown structure
             if content.strip():
                 validation_results["markdown_valid"] = True
-                print("✓ File contains content")
+                _verbose_print("✓ File contains content")
                 
                 # Basic markdown structure check
-                if re.search(r'^#\s+', content, re.MULTILINE):
-                    print("✓ Contains markdown headers")
+                if MARKDOWN_HEADER_RE.search(content):
+                    _verbose_print("✓ Contains markdown headers")
                 else:
                     validation_results["warnings"].append("No markdown headers found")
             
             # Check for structural integrity
-            required_sections = [
-                "BINDING ENFORCEMENT PROTOCOL",
-                "CRITICAL BINDING STATEMENTS",
-                "ENFORCEMENT MECHANISMS"
+            found_sections = set(REQUIRED_SECTIONS_RE.findall(content))
+            missing_sections = [
+                section for section in REQUIRED_SECTIONS
+                if section not in found_sections
             ]
             
-            missing_sections = []
-            for section in required_sections:
-                if section not in content:
-                    missing_sections.append(section)
-            
             if not missing_sections:
                 validation_results["structure_valid"] = True
-                print("✓ Required sections present")
+                _verbose_print("✓ Required sections present")
             else:
                 validation_results["issues"].extend(missing_sections)
                 print(f"⚠️ Missing sections: {', '.join(missing_sections)}")
             
             # Basic security check - look for obviously dangerous patterns
-            dangerous_patterns = [
-                r'rm\s+-rf\s+/',
-                r'sudo\s+rm',
-                r'eval\s*\(',
-                r'exec\s*\(',
-                r'__import__\s*\(',
-                r'subprocess\.call\s*\([^)]*shell\s*=\s*True'
-            ]
-            
             security_issues = []
-            for pattern in dangerous_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    security_issues.append(f"Potentially dangerous pattern: {pattern}")
+            if DANGEROUS_ANY_RE.search(content):
+                # Only on a hit: identify every pattern involved for the report
+                for pattern in DANGEROUS_PATTERNS:
+                    if pattern.search(content):
+                        security_issues.append(f"Potentially dangerous pattern: {pattern.pattern}")
             
             if not security_issues:
                 validation_results["security_safe"] = True
-                print("✓ No obvious security issues detected")
+                _verbose_print("✓ No obvious security issues detected")
             else:
                 validation_results["issues"].extend(security_issues)
                 validation_results["valid"] = False
@@ -350,26 +465,40 @@ Dependencies: [Listed from package files]
         print("⚙️ Parsing project-specific configurations...")
         
         try:
-            with open(self.project_claude_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_project_claude_md()
+            
+            # Lowercase once and collect every keyword hit in a single pass
+            lowered = content.lower()
+            keywords = {kw for kw in CONFIG_KEYWORDS if kw in lowered}
             
             config = {
-                "testing_protocol": self._extract_testing_protocol(content),
-                "parallel_execution": self._extract_parallel_config(content),
-                "pattern_library": self._extract_pattern_config(content),
-                "coding_standards": self._extract_coding_standards(content),
+                "testing_protocol": self._extract_testing_protocol(content, keywords),
+                "parallel_execution": self._extract_parallel_config(content, keywords),
+                "pattern_library": self._extract_pattern_config(content, keywords),
+                "coding_standards": self._extract_coding_standards(content, keywords),
                 "project_specific_rules": self._extract_project_rules(content)
             }
             
             self.project_config = config
-            print("✓ Project configuration parsed successfully")
+            _verbose_print("✓ Project configuration parsed successfully")
             return config
             
         except Exception as e:
             print(f"❌ Failed to parse project configuration: {e}")
             return {}
     
-    def _extract_testing_protocol(self, content: str) -> Dict:
+    def _read_project_claude_md(self) -> str:
+        """Return project CLAUDE.md content, reusing the copy read during validation"""
+        claude_path = str(self.project_claude_path)
+        if self._claude_md_cache and self._claude_md_cache[0] == claude_path:
+            return self._claude_md_cache[1]
+        
+        with open(claude_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._claude_md_cache = (claude_path, content)
+        return content
+    
+    def _extract_testing_protocol(self, content: str, keywords: Set[str]) -> Dict:
         """Extract testing protocol from CLAUDE.md content"""
         testing_config = {}
         
@@ -381,24 +510,18 @@ Dependencies: [Listed from package files]
                 testing_config["seven_step_protocol"] = True
         
         # Look for TDD requirements
-        if "test-first development" in content.lower() or "tdd" in content.lower():
+        if "test-first development" in keywords or "tdd" in keywords:
             testing_config["tdd_preferred"] = True
         
         return testing_config
     
-    def _extract_parallel_config(self, content: str) -> Dict:
+    def _extract_parallel_config(self, content: str, keywords: Set[str]) -> Dict:
         """Extract parallel execution configuration"""
         parallel_config = {}
         
         # Look for agent configurations
-        agent_patterns = [
-            r"(\d+)\s*agents?",
-            r"Deploy\s+(\d+)",
-            r"(\d+)-agent"
-        ]
-        
-        for pattern in agent_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in AGENT_COUNT_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 agent_counts = [int(m) for m in matches if m.isdigit()]
                 if agent_counts:
@@ -406,14 +529,14 @@ Dependencies: [Listed from package files]
                     break
         
         # Look for execution mode preferences
-        if "parallel" in content.lower():
+        if "parallel" in keywords:
             parallel_config["parallel_preferred"] = True
-        if "sequential" in content.lower():
+        if "sequential" in keywords:
             parallel_config["sequential_required"] = True
         
         return parallel_config
     
-    def _extract_pattern_config(self, content: str) -> Dict:
+    def _extract_pattern_config(self, content: str, keywords: Set[str]) -> Dict:
         """Extract pattern library configuration"""
         pattern_config = {}
         
@@ -422,25 +545,25 @@ Dependencies: [Listed from package files]
             pattern_config["pattern_dir"] = "patterns/"
         
         # Look for pattern application rules
-        if "pattern" in content.lower() and "before" in content.lower():
+        if "pattern" in keywords and "before" in keywords:
             pattern_config["check_patterns_first"] = True
         
         return pattern_config
     
-    def _extract_coding_standards(self, content: str) -> Dict:
+    def _extract_coding_standards(self, content: str, keywords: Set[str]) -> Dict:
         """Extract coding standards and directives"""
         standards = {}
         
         # Look for coding directives
-        directive_matches = re.findall(r"Directive\s+(\d+)", content, re.IGNORECASE)
+        directive_matches = DIRECTIVE_RE.findall(content)
         if directive_matches:
             standards["directive_count"] = len(directive_matches)
         
         # Look for specific standards
-        if "clean code" in content.lower():
+        if "clean code" in keywords:
             standards["clean_code_required"] = True
         
-        if "test coverage" in content.lower():
+        if "test coverage" in keywords:
             standards["test_coverage_required"] = True
         
         return standards
@@ -450,16 +573,12 @@ Dependencies: [Listed from package files]
         rules = []
         
         # Look for binding statements
-        binding_section = re.search(
-            r"CRITICAL BINDING STATEMENTS:(.*?)(?=###|$)", 
-            content, 
-            re.DOTALL | re.IGNORECASE
-        )
+        binding_section = BINDING_SECTION_RE.search(content)
         
         if binding_section:
             binding_text = binding_section.group(1)
             # Extract numbered rules
-            rule_matches = re.findall(r"\d+\.\s*\*\*(.*?)\*\*", binding_text)
+            rule_matches = NUMBERED_RULE_RE.findall(binding_text)
             rules.extend(rule_matches)
         
         return rules
@@ -485,11 +604,19 @@ Dependencies: [Listed from package files]
         
         for category in categories:
             category_dir = patterns_dir / category
-            if category_dir.exists():
-                pattern_files = list(category_dir.glob("*.md"))
-                if pattern_files:
-                    print(f"✓ Found {len(pattern_files)} patterns in {category}/")
-                    pattern_library[category] = [str(f) for f in pattern_files]
+            try:
+                # DirEntry carries file type from the directory read - no per-file stat
+                with os.scandir(category_dir) as entries:
+                    pattern_files = [
+                        entry.path for entry in entries
+                        if entry.name.endswith(".md") and not entry.name.startswith(".")
+                        and entry.is_file()
+                    ]
+            except OSError:
+                continue
+            if pattern_files:
+                _verbose_print(f"✓ Found {len(pattern_files)} patterns in {category}/")
+                pattern_library[category] = pattern_files
         
         # Skip fabric patterns - use on-demand loading instead
         fabric_dir = patterns_dir / "fabric"
@@ -502,10 +629,10 @@ Dependencies: [Listed from package files]
     
     def generate_loading_report(self) -> str:
         """Generate a comprehensive loading report"""
-        report = f"""# Project CLAUDE.md Loading Report
+        parts = [f"""# Project CLAUDE.md Loading Report
 Generated: {Path().cwd()}
 User: Christian
-Timestamp: {os.popen('date -u +%Y-%m-%dT%H:%M:%SZ').read().strip()}
+Timestamp: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}
 
 ## Project Discovery Results
 - Project Root: {self.project_root}
@@ -513,37 +640,37 @@ Timestamp: {os.popen('date -u +%Y-%m-%dT%H:%M:%SZ').read().strip()}
 - Validation Status: {self.validation_results.get('valid', 'Not validated')}
 
 ## Configuration Loading
-"""
+"""]
         
         if self.project_config:
-            report += "✓ Project configuration loaded successfully\n\n"
-            report += "### Parsed Configuration:\n"
+            parts.append("✓ Project configuration loaded successfully\n\n")
+            parts.append("### Parsed Configuration:\n")
             for key, value in self.project_config.items():
-                report += f"- {key}: {value}\n"
+                parts.append(f"- {key}: {value}\n")
         else:
-            report += "ℹ️ No project configuration loaded (using global defaults)\n"
+            parts.append("ℹ️ No project configuration loaded (using global defaults)\n")
         
-        report += f"\n## Pattern Library Status\n"
+        parts.append(f"\n## Pattern Library Status\n")
         if self.pattern_library:
-            report += "✓ Pattern library loaded\n"
+            parts.append("✓ Pattern library loaded\n")
             for category, patterns in self.pattern_library.items():
-                report += f"- {category}: {len(patterns)} patterns\n"
+                parts.append(f"- {category}: {len(patterns)} patterns\n")
         else:
-            report += "ℹ️ No pattern library found\n"
+            parts.append("ℹ️ No pattern library found\n")
         
         if self.validation_results:
-            report += f"\n## Validation Details\n"
+            parts.append(f"\n## Validation Details\n")
             if self.validation_results.get("issues"):
-                report += "### Issues Found:\n"
+                parts.append("### Issues Found:\n")
                 for issue in self.validation_results["issues"]:
-                    report += f"- ❌ {issue}\n"
+                    parts.append(f"- ❌ {issue}\n")
             
             if self.validation_results.get("warnings"):
-                report += "### Warnings:\n"
+                parts.append("### Warnings:\n")
                 for warning in self.validation_results["warnings"]:
-                    report += f"- ⚠️ {warning}\n"
+                    parts.append(f"- ⚠️ {warning}\n")
         
-        return report
+        return "".join(parts)
     
     def execute_complete_loading_sequence(self) -> Dict:
         """
@@ -588,20 +715,26 @@ Timestamp: {os.popen('date -u +%Y-%m-%dT%H:%M:%SZ').read().strip()}
 
 def main():
     """Main execution function for testing the loader"""
+    import argparse
+    
+    global VERBOSE
+    parser = argparse.ArgumentParser(description="Load project CLAUDE.md configuration")
+    parser.add_argument("--verbose", action="store_true", help="Show every passing check")
+    args = parser.parse_args()
+    VERBOSE = VERBOSE or args.verbose
+    
     loader = ProjectCLAUDELoader()
     results = loader.execute_complete_loading_sequence()
     
     # Save results to file
     results_file = Path("project_claude_loading_results.json")
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    _write_file_bytes(results_file, _dump_json_bytes(results))
     
     print(f"\n📄 Results saved to: {results_file}")
     
     # Save loading report
     report_file = Path("PROJECT_CLAUDE_LOADING_REPORT.md")
-    with open(report_file, 'w') as f:
-        f.write(results["report"])
+    _write_file_bytes(report_file, results["report"].encode('utf-8'))
     
     print(f"📋 Report saved to: {report_file}")
 
@@ -13,10 +13,12 @@ Created for: Christian
 Purpose: Eliminate the 24.6k token overhead from repeated executions
 """
 
+import io
 import os
 import json
 import time
 import hashlib
+import functools
 from pathlib import Path
 from typing import Dict, Optional, Any
 from dataclasses import dataclass, asdict
@@ -29,6 +31,25 @@ try:
 except ImportError:
     LEARNING_ENABLED = False
 
+# Fast JSON serialization for the session state file when orjson is available
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    ORJSON_ENABLED = False
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes without a str round-trip"""
+    if ORJSON_ENABLED:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON from raw file bytes"""
+    if ORJSON_ENABLED:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 @dataclass
 class SessionState:
     """Session state data structure"""
@@ -56,6 +77,11 @@ class SessionStateManager:
         self.state: Optional[SessionState] = None
         self.session_id = self._generate_session_id()
         
+        # (mtime_ns, size) of the session file as last read or written, and
+        # the signature self.state was loaded from or saved as
+        self._file_signature = None
+        self._state_signature = None
+        
         # Cache optimization settings
         self.session_timeout_hours = float(os.environ.get('CLAUDE_SESSION_TIMEOUT_HOURS', '8'))  # Extended from 2 to 8 hours
         self.max_session_lifetime_hours = float(os.environ.get('CLAUDE_MAX_SESSION_HOURS', '24'))  # Hard limit: 24 hours
@@ -75,16 +101,24 @@ class SessionStateManager:
     def _get_file_hash(self, file_path: Path) -> str:
         """Get SHA-256 hash of file content for change detection"""
         try:
-            if not file_path.exists():
-                return "missing"
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return "missing"
+        except Exception:
+            return "error"
+        try:
+            # One positional read sized from fstat instead of buffered file reads
+            data = os.pread(fd, os.fstat(fd).st_size, 0)
+            return hashlib.sha256(data).hexdigest()
         except Exception:
             return "error"
+        finally:
+            os.close(fd)
     
     def _safe_file_operation(self, operation: str, **kwargs):
         """Thread-safe file operations with locking"""
         lock_file = self.session_file.with_suffix('.lock')
+        self._file_signature = None
         try:
             with open(lock_file, 'w') as lock:
                 fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
@@ -92,12 +126,19 @@ class SessionStateManager:
                 if operation == 'read':
                     if not self.session_file.exists():
                         return None
-                    with open(self.session_file, 'r') as f:
-                        return json.load(f)
+                    with open(self.session_file, 'rb') as f:
+                        raw = f.read()
+                        st = os.fstat(f.fileno())
+                    data = _load_json_bytes(raw)
+                    self._file_signature = (st.st_mtime_ns, st.st_size)
+                    return data
                         
                 elif operation == 'write':
-                    with open(self.session_file, 'w') as f:
-                        json.dump(kwargs['data'], f, indent=2)
+                    with open(self.session_file, 'wb') as f:
+                        f.write(_dump_json_bytes(kwargs['data']))
+                        f.flush()
+                        st = os.fstat(f.fileno())
+                    self._file_signature = (st.st_mtime_ns, st.st_size)
                         
         except Exception as e:
             if operation == 'read':
@@ -115,12 +156,20 @@ class SessionStateManager:
         This is the KEY OPTIMIZATION that prevents redundant executions
         OPTIMIZED: Uses flexible timeout, content hashing, and thread-safe file operations
         """
-        if not self.session_file.exists():
+        try:
+            st = os.stat(self.session_file)
+        except OSError:
             return False
         
-        data = self._safe_file_operation('read')
-        if data is None:
-            return False
+        # File unchanged since this manager last loaded or saved it: check the
+        # in-memory state instead of locking, re-reading and re-parsing
+        cached = self.state is not None and (st.st_mtime_ns, st.st_size) == self._state_signature
+        if cached:
+            data = vars(self.state)
+        else:
+            data = self._safe_file_operation('read')
+            if data is None:
+                return False
             
         try:
             # Check sliding window timeout (activity-based)
@@ -140,6 +189,9 @@ class SessionStateManager:
             # Check if configuration is loaded
             if not data.get('config_loaded', False):
                 return False
+            
+            if cached:
+                return True
                 
             # Session is active and has config - populate state
             # Handle missing config_file_hashes for backward compatibility
@@ -147,6 +199,7 @@ class SessionStateManager:
                 data['config_file_hashes'] = {}
                 
             self.state = SessionState(**data)
+            self._state_signature = self._file_signature
             return True
             
         except (TypeError, KeyError) as e:
@@ -258,16 +311,19 @@ class SessionStateManager:
             
         return False
     
-    def _get_config_files(self) -> list[Path]:
-        """Get list of configuration files to monitor for changes"""
-        config_files = [
+    def _monitored_config_paths(self) -> list[Path]:
+        """Every configuration file watched for changes, present or not"""
+        return [
             self.project_root / "CLAUDE.md",
             # Add other config files that OptimizedProjectLoader might use
             self.project_root / "pyproject.toml",
             self.project_root / "package.json",
             self.project_root / ".env"
         ]
-        return [f for f in config_files if f.exists()]
+    
+    def _get_config_files(self) -> list[Path]:
+        """Get list of configuration files to monitor for changes"""
+        return [f for f in self._monitored_config_paths() if f.exists()]
     
     def _config_files_changed(self) -> bool:
         """
@@ -306,6 +362,7 @@ class SessionStateManager:
         """Save session state to disk with thread safety"""
         try:
             self._safe_file_operation('write', data=asdict(self.state))
+            self._state_signature = self._file_signature
         except Exception as e:
             print(f"⚠️ Failed to save session state: {e}")
     
@@ -374,8 +431,17 @@ class SessionStateManager:
     def _prune_side_effects_log(self, side_effects_file):
         """Prune side_effects_log.md to keep last 200 entries"""
         try:
-            with open(side_effects_file, 'r') as f:
-                lines = f.readlines()
+            fd = os.open(side_effects_file, os.O_RDONLY)
+            try:
+                raw = os.pread(fd, os.fstat(fd).st_size, 0)
+            finally:
+                os.close(fd)
+            
+            # Count newlines on the raw bytes; only decode and split into
+            # lines once the log is long enough that pruning may apply
+            if raw.count(b"\n") < 400:
+                return
+            lines = io.StringIO(raw.decode('utf-8'), newline=None).readlines()
             
             # If file is getting large (>400 lines), prune to last 200 entries
             if len(lines) > 400:
@@ -422,22 +488,45 @@ class SmartConfigurationManager:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
         self.session_manager = SessionStateManager(project_root)
-        self._config_cache = {}
+        self._config_signature = None
+        self.full_load_count = 0
     
     def get_project_configuration(self, force_reload: bool = False) -> Dict[str, Any]:
         """
         Get project configuration with smart caching
         This is the MAIN METHOD that prevents redundant executions
+        The returned dict is the cached session config itself - treat it as read-only
         """
         # Check for cached config first
         if not force_reload:
-            cached_config = self.session_manager.get_cached_config()
-            if cached_config:
-                return cached_config
+            # The signature only invalidates: a change on disk since the last
+            # load skips the session cache. Session expiry and access tracking
+            # still run through get_cached_config() on every call.
+            signature = self._get_config_signature()
+            if self._config_signature is None or signature == self._config_signature:
+                cached_config = self.session_manager.get_cached_config()
+                if cached_config:
+                    self._config_signature = signature
+                    return cached_config
         
         # If no cache or force reload, run full loading
         print("⚙️ Loading project configuration (required)")
-        return self._load_configuration_once()
+        self.full_load_count += 1
+        config = self._load_configuration_once()
+        self._config_signature = self._get_config_signature()
+        return config
+    
+    def _get_config_signature(self) -> tuple:
+        """(mtime_ns, size) of every monitored config file, None for missing ones"""
+        signature = []
+        for file_path in self.session_manager._monitored_config_paths():
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((stat_result.st_mtime_ns, stat_result.st_size))
+        return tuple(signature)
     
     def _load_configuration_once(self) -> Dict[str, Any]:
         """
@@ -509,13 +598,25 @@ class SmartConfigurationManager:
             'cache_status': 'active' if self.session_manager.state else 'fresh'
         }
 
+@functools.lru_cache(maxsize=8)
+def _cached_configuration_manager(resolved_root: str) -> SmartConfigurationManager:
+    """Build one SmartConfigurationManager per resolved project root"""
+    return SmartConfigurationManager(resolved_root)
+
+def get_configuration_manager(project_root: str = ".") -> SmartConfigurationManager:
+    """
+    Shared manager for the helper functions below
+    Reuses the same instance (and its loaded session state) per project
+    """
+    return _cached_configuration_manager(str(Path(project_root).resolve()))
+
 # Integration helper functions for existing CLAUDE.md
 def check_tdd_protocol() -> bool:
     """
     Replacement for TDD protocol check that uses cached config
     Use this instead of running full project_claude_loader
     """
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     return manager.is_tdd_protocol_active()
 
 def get_project_agent_count() -> int:
@@ -523,7 +624,7 @@ def get_project_agent_count() -> int:
     Replacement for agent count check that uses cached config
     Use this instead of running full project_claude_loader
     """
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     return manager.get_default_agent_count()
 
 def verify_pattern_first() -> bool:
@@ -531,7 +632,7 @@ def verify_pattern_first() -> bool:
     Replacement for pattern-first check that uses cached config
     Use this instead of running full project_claude_loader
     """
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     return manager.is_pattern_first_active()
 
 def get_optimized_session_status() -> Dict[str, Any]:
@@ -539,7 +640,7 @@ def get_optimized_session_status() -> Dict[str, Any]:
     Get complete session status with minimal overhead
     Use this for all configuration checks
     """
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     return manager.get_session_summary()
 
 # OPTIMIZED: New helper functions for cache hit optimization
@@ -548,7 +649,7 @@ def timing_check(rule_name: str = None) -> Dict[str, Any]:
     Fast timing rules check - uses cached config
     Replaces direct timing system calls to improve cache hit rate
     """
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     timing_rules = manager.get_timing_rules()
     
     if rule_name:
@@ -560,7 +661,7 @@ def learning_access(file_type: str = None) -> list:
     Fast learning files access - uses cached config  
     Replaces direct learning file discovery to improve cache hit rate
     """
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     learning_files = manager.get_learning_files()
     
     if file_type:
@@ -573,7 +674,7 @@ def main():
     
     # Test cache timeout configuration
     print(f"📊 Cache Configuration:")
-    manager = SmartConfigurationManager()
+    manager = get_configuration_manager()
     print(f"  Session timeout: {manager.session_manager.session_timeout_hours} hours")
     print(f"  Max lifetime: {manager.session_manager.max_session_lifetime_hours} hours")
     
@@ -582,15 +683,14 @@ def main():
     
     # First call - should run full loader
     print("\n=== First Configuration Load ===")
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     config1 = manager.get_project_configuration()
-    load_time = (time.time() - start_time) * 1000
-    operations.append(('full_load', False, load_time))
+    load_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     
     # Rapid successive calls - should all use cache
     print("\n=== Cache Performance Test (15 operations) ===")
     for i in range(15):
-        start_time = time.time()
+        loads_before = manager.full_load_count
         
         if i % 5 == 0:
             # Mix of operation types to simulate real usage
@@ -603,18 +703,19 @@ def main():
             result = manager.get_project_configuration()
             op_type = "config_access"
             
-        access_time = (time.time() - start_time) * 1000
-        cache_hit = access_time < 1.0  # Cache hits should be sub-millisecond
-        operations.append((op_type, cache_hit, access_time))
+        # A hit is any access that did not trigger a full loader run
+        cache_hit = manager.full_load_count == loads_before
+        operations.append((op_type, cache_hit))
         
-        print(f"  {op_type}: {'HIT' if cache_hit else 'MISS'} ({access_time:.2f}ms)")
+        print(f"  {op_type}: {'HIT' if cache_hit else 'MISS'}")
     
     # Calculate cache performance
-    total_ops = len(operations) - 1  # Exclude first full load
-    cache_hits = sum(1 for _, hit, _ in operations[1:] if hit)
+    total_ops = len(operations)
+    cache_hits = sum(1 for _, hit in operations if hit)
     hit_rate = (cache_hits / total_ops) * 100
     
     print(f"\n📈 Cache Performance Summary:")
+    print(f"  First load time: {load_time_ms:.1f}ms")
     print(f"  Total operations: {total_ops}")
     print(f"  Cache hits: {cache_hits}")
     print(f"  Hit rate: {hit_rate:.1f}%")
@@ -27,18 +27,19 @@ class UnifiedMemoryInterface:
     
     def _initialize_unified_memory(self):
         """Initialize unified memory structure"""
+        now = datetime.now(timezone.utc).isoformat()
         initial_data = {
             "metadata": {
                 "version": "1.0.0",
-                "created": datetime.now(timezone.utc).isoformat(),
+                "created": now,
                 "user": "Christian",
-                "last_updated": datetime.now(timezone.utc).isoformat()
+                "last_updated": now
             },
             "sessions": {},
             "patterns": {},
             "errors": {},
             "analytics": {
-                "last_updated": datetime.now(timezone.utc).isoformat(),
+                "last_updated": now,
                 "totals": {
                     "patterns_available": 0,
                     "patterns_used": 0,
@@ -74,11 +75,12 @@ class UnifiedMemoryInterface:
     def start_session(self, context: str = "work") -> str:
         """Start new session and return session_id"""
         data = self._load_memory()
-        session_id = f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now(timezone.utc)
+        session_id = f"{now.strftime('%Y%m%d_%H%M%S')}"
         
         data["sessions"][session_id] = {
             "session_id": session_id,
-            "start_time": datetime.now(timezone.utc).isoformat(),
+            "start_time": now.isoformat(),
             "end_time": None,
             "user": "Christian",
             "context": context,
@@ -143,6 +145,7 @@ class UnifiedMemoryInterface:
         # Update error tracking
         data = self._load_memory()
         error_id = f"ERROR_{error_pattern.upper().replace(' ', '_')}"
+        now = datetime.now(timezone.utc).isoformat()
         
         if error_id not in data["errors"]:
             data["errors"][error_id] = {
@@ -151,8 +154,8 @@ class UnifiedMemoryInterface:
                 "category": kwargs.get("category", "implementation"),
                 "frequency": "low",
                 "status": "resolved",
-                "first_occurrence": datetime.now(timezone.utc).isoformat(),
-                "last_occurrence": datetime.now(timezone.utc).isoformat(),
+                "first_occurrence": now,
+                "last_occurrence": now,
                 "root_cause": kwargs.get("root_cause", ""),
                 "resolution_activity_id": activity_id,
                 "prevention_pattern_id": kwargs.get("prevention_pattern_id"),
@@ -161,7 +164,7 @@ class UnifiedMemoryInterface:
             }
         else:
             data["errors"][error_id]["status"] = "resolved"
-            data["errors"][error_id]["last_occurrence"] = datetime.now(timezone.utc).isoformat()
+            data["errors"][error_id]["last_occurrence"] = now
             data["errors"][error_id]["resolution_activity_id"] = activity_id
         
         self._save_memory(data)
@@ -257,30 +260,28 @@ class UnifiedMemoryInterface:
         if activity["type"] == "pattern_usage":
             analytics["totals"]["total_applications"] += 1
             
-            # Update success rate
-            total_activities = sum(
-                len(session["activities"]) 
-                for session in data["sessions"].values()
-            )
-            successful_activities = len([
-                a for session in data["sessions"].values()
-                for a in session["activities"]
-                if a["result"] == "success"
-            ])
+            # Success and quality buckets, accumulated in one pass over activities
+            total_activities = 0
+            successful_activities = 0
+            quality_total = 0
+            quality_count = 0
+            for session in data["sessions"].values():
+                for a in session["activities"]:
+                    total_activities += 1
+                    if a["result"] == "success":
+                        successful_activities += 1
+                    score = a.get("quality_metrics", {}).get("overall_score", 0)
+                    if score > 0:
+                        quality_total += score
+                        quality_count += 1
             
+            # Update success rate
             if total_activities > 0:
                 analytics["totals"]["success_rate"] = (successful_activities / total_activities) * 100
             
             # Update average quality
-            quality_scores = [
-                a.get("quality_metrics", {}).get("overall_score", 0)
-                for session in data["sessions"].values()
-                for a in session["activities"]
-                if a.get("quality_metrics", {}).get("overall_score", 0) > 0
-            ]
-            
-            if quality_scores:
-                analytics["totals"]["average_quality"] = sum(quality_scores) / len(quality_scores)
+            if quality_count:
+                analytics["totals"]["average_quality"] = quality_total / quality_count
             
             # Update time saved
             time_saved = activity.get("impact_metrics", {}).get("time_saved", 0)
@@ -0,0 +1,34 @@
+"""Keyword tokenization in scripts/pattern_matcher.py"""
+
+import re
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent / "scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+from pattern_matcher import _split_tokens
+
+
+def _regex_tokens(text):
+    """Reference tokenizer: split on every non-word, non-space character"""
+    return re.sub(r'[^\w\s]', ' ', text.lower()).split()
+
+
+def test_non_ascii_punctuation_separates_tokens():
+    text = "Agent’s configuration—parallel “boot” │───▶│ cache…state"
+    assert _split_tokens(text) == [
+        "agent", "s", "configuration", "parallel", "boot", "cache", "state"
+    ]
+
+
+def test_matches_regex_tokenizer():
+    samples = [
+        "Fix: null-pointer (NPE) in boot_sequence!",
+        "tab\tand\x00null\x7fdel\x1bescape",
+        "Ünïcödé words — kept, “quotes” dropped",
+        "",
+    ]
+    for text in samples:
+        assert _split_tokens(text) == _regex_tokens(text)
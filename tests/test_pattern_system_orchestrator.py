@@ -0,0 +1,47 @@
+"""Shell step deadline in scripts/pattern_system_orchestrator.py"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent / "scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+import pattern_system_orchestrator as orchestrator
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="steps run through /bin/sh")
+
+
+def _run_step(command, tmp_path, timeout=1):
+    return asyncio.run(orchestrator._run_shell_step(command, tmp_path, timeout))
+
+
+def test_step_output_is_captured(tmp_path):
+    result = _run_step("echo ok", tmp_path)
+    assert result.returncode == 0
+    assert result.stdout == "ok\n"
+
+
+@pytest.mark.parametrize("command", [
+    "sleep 5; echo hi",
+    "(sleep 5 &) ; sleep 10",
+])
+def test_timeout_kills_the_whole_step(tmp_path, command):
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_step(command, tmp_path)
+    assert time.monotonic() - start < 3
+
+
+def test_timeout_without_process_groups(tmp_path, monkeypatch):
+    # Platforms without os.killpg fall back to killing the shell itself
+    monkeypatch.delattr(orchestrator.os, "killpg")
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_step("exec sleep 5", tmp_path)
+    assert time.monotonic() - start < 3
@@ -13,13 +13,21 @@ Purpose: Platform-specific compatibility validation and recommendations
 import os
 import sys
 import platform
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import time
 
 
+# Make the framework importable once, instead of on every validation step
+FRAMEWORK_DIR = Path(__file__).parent
+if str(FRAMEWORK_DIR) not in sys.path:
+    sys.path.insert(0, str(FRAMEWORK_DIR))
+
+
 class PlatformCompatibilityValidator:
     """Validates Claude Enhancement Framework compatibility on current platform."""
     
@@ -41,6 +49,21 @@ class PlatformCompatibilityValidator:
             "platform_limitations": {},
             "recommendations": []
         }
+        
+        # Scratch directory shared by all filesystem checks, created on first use
+        self._scratch_dir = None
+    
+    def _get_scratch_dir(self) -> Path:
+        """Return the shared scratch directory, creating it once per run."""
+        if self._scratch_dir is None:
+            self._scratch_dir = tempfile.TemporaryDirectory(prefix="claude_validation_")
+        return Path(self._scratch_dir.name)
+    
+    def _cleanup_scratch_dir(self):
+        """Remove the shared scratch directory once all checks are done."""
+        if self._scratch_dir is not None:
+            self._scratch_dir.cleanup()
+            self._scratch_dir = None
     
     def run_validation(self):
         """Execute complete platform compatibility validation."""
@@ -51,12 +74,15 @@ class PlatformCompatibilityValidator:
         print(f"Python: {self.python_version.major}.{self.python_version.minor}.{self.python_version.micro}")
         print()
         
-        self.validate_system_requirements()
-        self.validate_python_environment()
-        self.validate_framework_compatibility()
-        self.validate_performance_expectations()
-        self.validate_platform_specific_features()
-        self.generate_recommendations()
+        try:
+            self.validate_system_requirements()
+            self.validate_python_environment()
+            self.validate_framework_compatibility()
+            self.validate_performance_expectations()
+            self.validate_platform_specific_features()
+            self.generate_recommendations()
+        finally:
+            self._cleanup_scratch_dir()
         
         self.display_validation_results()
         return self.validation_results
@@ -65,13 +91,20 @@ class PlatformCompatibilityValidator:
         """Validate system requirements for framework deployment."""
         print("📋 Validating System Requirements...")
         
+        # The I/O-bound probes are independent, so overlap their waits
+        probes = {
+            "file_system_access": self._test_file_system_access,
+            "network_access": self._test_network_access,
+            "shell_access": self._test_shell_access
+        }
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {name: executor.submit(probe) for name, probe in probes.items()}
+        
         requirements = {
             "python_version": self.python_version >= (3, 8),
             "platform_supported": self.platform_name in ["Darwin", "Linux", "Windows"],
             "architecture_supported": True,  # All common architectures supported
-            "file_system_access": self._test_file_system_access(),
-            "network_access": self._test_network_access(),
-            "shell_access": self._test_shell_access()
+            **{name: future.result() for name, future in futures.items()}
         }
         
         self.validation_results["compatibility_status"]["system_requirements"] = requirements
@@ -88,11 +121,10 @@ class PlatformCompatibilityValidator:
     def _test_file_system_access(self):
         """Test file system read/write capabilities."""
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                test_file = Path(temp_dir) / "test_access.txt"
-                test_file.write_text("test")
-                content = test_file.read_text()
-                return content == "test"
+            test_file = self._get_scratch_dir() / "test_access.txt"
+            test_file.write_text("test")
+            content = test_file.read_text()
+            return content == "test"
         except:
             return False
     
@@ -110,7 +142,8 @@ class PlatformCompatibilityValidator:
         """Test shell command execution capability."""
         try:
             result = subprocess.run(["python", "--version"], 
-                                  capture_output=True, text=True, timeout=10)
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, 
+                                  timeout=10)
             return result.returncode == 0
         except:
             return False
@@ -190,7 +223,7 @@ class PlatformCompatibilityValidator:
         print("🔧 Validating Framework Compatibility...")
         
         # Test framework import capability
-        framework_dir = Path(__file__).parent
+        framework_dir = FRAMEWORK_DIR
         framework_tests = {
             "framework_directory": framework_dir.exists(),
             "claude_enhancer_module": (framework_dir / "claude_enhancer").exists(),
@@ -202,7 +235,6 @@ class PlatformCompatibilityValidator:
         # Test PathManager functionality
         pathmanager_tests = {}
         try:
-            sys.path.insert(0, str(framework_dir))
             from claude_enhancer.core.path_manager import PathManager
             
             pm = PathManager()
@@ -251,7 +283,6 @@ class PlatformCompatibilityValidator:
         # Test import time
         start_time = time.perf_counter()
         try:
-            sys.path.insert(0, str(Path(__file__).parent))
             from claude_enhancer.core.path_manager import PathManager
             import_time = (time.perf_counter() - start_time) * 1000
             performance_tests["import_time_ms"] = round(import_time, 3)
@@ -338,70 +369,74 @@ class PlatformCompatibilityValidator:
         features = {}
         
         # Test case sensitivity
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                file1 = Path(temp_dir) / "TestFile.txt"
-                file2 = Path(temp_dir) / "testfile.txt"
-                file1.write_text("test1")
-                file2.write_text("test2")
-                features["case_sensitive_filesystem"] = file1.read_text() != file2.read_text()
-            except:
-                features["case_sensitive_filesystem"] = None
+        try:
+            case_dir = self._get_scratch_dir() / "case_test"
+            case_dir.mkdir(exist_ok=True)
+            file1 = case_dir / "TestFile.txt"
+            file2 = case_dir / "testfile.txt"
+            file1.write_text("test1")
+            file2.write_text("test2")
+            features["case_sensitive_filesystem"] = file1.read_text() != file2.read_text()
+        except:
+            features["case_sensitive_filesystem"] = None
         
         # Test executable permissions
         try:
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-                temp_path.chmod(0o755)
-                features["executable_permissions"] = os.access(temp_path, os.X_OK)
-                temp_path.unlink()
+            temp_path = self._get_scratch_dir() / "exec_test"
+            temp_path.touch()
+            temp_path.chmod(0o755)
+            features["executable_permissions"] = os.access(temp_path, os.X_OK)
         except:
             features["executable_permissions"] = False
         
         # Test launchd availability (service management)
         try:
             result = subprocess.run(["launchctl", "version"], 
-                                  capture_output=True, text=True, timeout=5)
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, 
+                                  timeout=5)
             features["launchd_available"] = result.returncode == 0
         except:
             features["launchd_available"] = False
         
         return features
     
+    def _run_probe(self, command, timeout, capture=False):
+        """Run a feature probe command; None if it cannot be run."""
+        try:
+            if capture:
+                return subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+            return subprocess.run(command, stdout=subprocess.DEVNULL, 
+                                  stderr=subprocess.DEVNULL, timeout=timeout)
+        except:
+            return None
+    
     def _validate_linux_features(self):
         """Validate Linux-specific features."""
         features = {}
         
+        # systemd and SELinux probes are independent - start both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            systemd_probe = executor.submit(self._run_probe, ["systemctl", "--version"], 5)
+            selinux_probe = executor.submit(self._run_probe, ["sestatus"], 5, True)
+        
         # Test systemd availability
-        try:
-            result = subprocess.run(["systemctl", "--version"], 
-                                  capture_output=True, text=True, timeout=5)
-            features["systemd_available"] = result.returncode == 0
-        except:
-            features["systemd_available"] = False
+        result = systemd_probe.result()
+        features["systemd_available"] = result is not None and result.returncode == 0
         
         # Test SELinux status
-        try:
-            result = subprocess.run(["sestatus"], 
-                                  capture_output=True, text=True, timeout=5)
-            features["selinux_present"] = result.returncode == 0
-            if features["selinux_present"]:
-                features["selinux_enforcing"] = "Enforcing" in result.stdout
-        except:
-            features["selinux_present"] = False
+        result = selinux_probe.result()
+        features["selinux_present"] = result is not None and result.returncode == 0
+        if features["selinux_present"]:
+            features["selinux_enforcing"] = "Enforcing" in result.stdout
         
         # Test package manager availability
         package_managers = ["apt", "yum", "dnf", "pacman", "zypper"]
         features["package_managers"] = []
         
+        # PATH lookup only - no need to spawn each tool just to see it exists
         for pm in package_managers:
-            try:
-                result = subprocess.run([pm, "--version"], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    features["package_managers"].append(pm)
-            except:
-                continue
+            if shutil.which(pm):
+                features["package_managers"].append(pm)
         
         features["package_manager_available"] = len(features["package_managers"]) > 0
         
@@ -411,21 +446,18 @@ class PlatformCompatibilityValidator:
         """Validate Windows-specific features."""
         features = {}
         
+        # PowerShell and service probes are independent - start both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            powershell_probe = executor.submit(self._run_probe, ["powershell", "-Command", "Get-Host"], 10)
+            services_probe = executor.submit(self._run_probe, ["sc", "query"], 10)
+        
         # Test PowerShell availability
-        try:
-            result = subprocess.run(["powershell", "-Command", "Get-Host"], 
-                                  capture_output=True, text=True, timeout=10)
-            features["powershell_available"] = result.returncode == 0
-        except:
-            features["powershell_available"] = False
+        result = powershell_probe.result()
+        features["powershell_available"] = result is not None and result.returncode == 0
         
         # Test Windows services
-        try:
-            result = subprocess.run(["sc", "query"], 
-                                  capture_output=True, text=True, timeout=10)
-            features["windows_services"] = result.returncode == 0
-        except:
-            features["windows_services"] = False
+        result = services_probe.result()
+        features["windows_services"] = result is not None and result.returncode == 0
         
         # Test long path support
         try:
@@ -550,7 +582,7 @@ class PlatformCompatibilityValidator:
             print(f"{recommendation}")
         
         # Save validation report
-        report_file = Path(__file__).parent / f"platform_validation_{self.platform_name.lower()}.json"
+        report_file = FRAMEWORK_DIR / f"platform_validation_{self.platform_name.lower()}.json"
         with open(report_file, 'w') as f:
             json.dump(self.validation_results, f, indent=2, default=str)
         